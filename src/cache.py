@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+# Bump when judge prompts/personas change so stale LLM answers are not reused.
+PROMPT_VERSION = "1"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# In-process layer over the llm/ disk cache: recent answers by key (LRU), and
+# calls currently in flight, so concurrent identical prompts share one request.
+_LLM_MEMORY: "OrderedDict[str, Any]" = OrderedDict()
+_LLM_MEMORY_SIZE = 512
+_LLM_INFLIGHT: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+def _repo_root() -> Path:
+    # repo root = same level as src/
+    return Path(__file__).resolve().parents[1]
+
+
+def cache_dir() -> Path:
+    """On-disk cache location for forensic results (audit/.cache/)."""
+    return _repo_root() / "audit" / ".cache"
+
+
+def cache_enabled() -> bool:
+    """Set AUDITOR_CACHE=off to bypass every disk cache."""
+    mode = os.getenv("AUDITOR_CACHE", "").lower().strip()
+    return mode not in ("off", "0", "false", "no")
+
+
+def load_json(name: str) -> Optional[Any]:
+    """Returns the cached JSON payload for `name`, or None on miss/corruption."""
+    if not cache_enabled():
+        return None
+
+    path = cache_dir() / f"{name}.json"
+    try:
+        if orjson is not None:
+            # orjson.JSONDecodeError is a ValueError
+            return orjson.loads(path.read_bytes())
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(name: str, data: Any) -> None:
+    """
+    Best-effort atomic write of a JSON payload.
+    A failed cache write must never fail the audit itself.
+    """
+    if not cache_enabled():
+        return
+
+    path = cache_dir() / f"{name}.json"
+    out_dir = path.parent
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            # orjson.JSONEncodeError is a TypeError
+            tmp_path.write_bytes(orjson.dumps(data))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"[WARN] Cache write failed for {name}: {e}")
+
+
+def llm_cache_key(model: str, prompt: str) -> str:
+    raw = f"{PROMPT_VERSION}\n{model}\n{prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _remember(key: str, payload: Any) -> None:
+    _LLM_MEMORY[key] = payload
+    _LLM_MEMORY.move_to_end(key)
+    while len(_LLM_MEMORY) > _LLM_MEMORY_SIZE:
+        _LLM_MEMORY.popitem(last=False)
+
+
+async def cached_llm_answer(model: str, prompt: str, schema: Type[ModelT]) -> Optional[ModelT]:
+    """
+    Looks a prompt up without calling the model: recent answers in memory, a
+    concurrent identical call, then audit/.cache/llm/. Returns None on a miss.
+    """
+    key = llm_cache_key(model, prompt)
+
+    if cache_enabled() and key in _LLM_MEMORY:
+        _LLM_MEMORY.move_to_end(key)
+        try:
+            return schema.model_validate(_LLM_MEMORY[key])
+        except ValidationError:
+            del _LLM_MEMORY[key]
+
+    pending = _LLM_INFLIGHT.get(key)
+    if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+        try:
+            payload = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this caller was cancelled, not the shared call
+            payload = None  # shared call was cancelled; make our own
+        if payload is not None:
+            return schema.model_validate(payload)
+
+    cached = load_json(f"llm/{key}")
+    if cached is not None:
+        try:
+            result = schema.model_validate(cached)
+            _remember(key, cached)
+            return result
+        except ValidationError:
+            pass
+    return None
+
+
+def remember_llm_answer(model: str, prompt: str, payload: Any) -> None:
+    """Stores a parsed answer (model_dump(mode="json")) on disk and in memory."""
+    key = llm_cache_key(model, prompt)
+    save_json(f"llm/{key}", payload)
+    if cache_enabled():
+        _remember(key, payload)
+
+
+async def ainvoke_cached(
+    structured_llm: Any,
+    prompt: str,
+    model: str,
+    schema: Type[ModelT],
+    throttle: Optional[Callable[[], Awaitable[None]]] = None,
+) -> ModelT:
+    """
+    Structured LLM call backed by audit/.cache/llm/<sha256>.json.
+    Same model + prompt (which embeds the evidence) -> same parsed answer, no API call.
+    Identical prompts within one process are also served from memory, and
+    concurrent identical calls share a single request.
+    `throttle` is awaited only before a real API call, so cache hits never wait on it.
+    Every caller gets its own freshly validated model instance.
+    """
+    cached = await cached_llm_answer(model, prompt, schema)
+    if cached is not None:
+        return cached
+
+    key = llm_cache_key(model, prompt)
+    future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+    _LLM_INFLIGHT[key] = future
+    try:
+        if throttle is not None:
+            await throttle()
+        result = await structured_llm.ainvoke(prompt)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # waiters re-raise it; don't warn if there are none
+        raise
+    else:
+        payload = result.model_dump(mode="json") if isinstance(result, BaseModel) else None
+        future.set_result(payload)
+        if payload is not None:
+            remember_llm_answer(model, prompt, payload)
+        return result
+    finally:
+        if _LLM_INFLIGHT.get(key) is future:
+            del _LLM_INFLIGHT[key]
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import functools
+
 from langgraph.graph import StateGraph, START, END
 
 from src.state import AgentState
 from src.nodes.detectives import repo_investigator, doc_analyst, vision_inspector
-from src.nodes.judges import prosecutor_judge, defense_judge, techlead_judge
-from src.nodes.justice import chief_justice
+from src.nodes.judges import prepare_judge_inputs, prosecutor_judge, defense_judge, techlead_judge
+from src.nodes.justice import chief_justice, prepare_rubric
 
 def evidence_aggregator(state: AgentState):
     """
     Explicit fan-in node for detective evidence.
-    Reducers in AgentState already merge evidence fields, so this node can be a no-op.
-    It exists to make fan-in visible in the LangGraph trace.
+    Reducers in AgentState already merge evidence fields; this node only
+    precomputes the evidence-derived judge inputs and the parsed rubric once
+    for the judges and chief justice.
+    It also makes fan-in visible in the LangGraph trace.
     """
-    return {}
+    return {
+        "judge_inputs": prepare_judge_inputs(state.get("evidences") or {}),
+        "rubric": prepare_rubric(),
+    }
 
 
 def opinion_aggregator(state: AgentState):
@@ -22,101 +29,98 @@ def opinion_aggregator(state: AgentState):
     Reducers in AgentState already merge opinion fields, so this node can be a no-op.
     """
     return {}
-def _has_failure_flag(state: AgentState, flag_names: tuple[str, ...]) -> bool:
-    """
-    Safely checks failure flags on the state.
-    Works even if your AgentState doesn't define these fields yet.
-    """
-    for name in flag_names:
-        try:
-            if bool(getattr(state, name, False)):
-                return True
-        except Exception:
-            continue
-    return False
 
 
 def route_after_repo(state: AgentState) -> str:
     """
-    If repo clone/scan fails, skip evidence aggregator and go straight to judges,
-    allowing them to still produce a verdict with partial evidence.
+    Repo clone/scan failures still proceed with partial evidence. The detective
+    records them in state["repo_failed"]; both outcomes currently go to the
+    aggregator, so the flag is not checked here.
     """
-    if _has_failure_flag(state, ("repo_ok", "repo_success")):
-        # If you ever store positive flags, treat False as failure.
-        # But we don't want to assume existence, so only use negative flags below.
-        pass
-
-    # Prefer explicit negative flags if present
-    if _has_failure_flag(state, ("repo_failed", "repo_error", "repo_clone_failed")):
-        return "evidence_aggregator"
     return "evidence_aggregator"
 
 
 def route_after_doc(state: AgentState) -> str:
     """
     If PDF parsing fails, still proceed (partial evidence).
+    Failures are recorded in state["doc_failed"].
     """
-    if _has_failure_flag(state, ("doc_failed", "doc_error", "pdf_failed", "pdf_parse_failed")):
-        return "evidence_aggregator"
     return "evidence_aggregator"
 
 
 def route_after_vision(state: AgentState) -> str:
     """
     If PDF image extraction/inspection fails, still proceed (partial evidence).
+    Failures are recorded in state["vision_failed"].
     """
-    if _has_failure_flag(state, ("vision_failed", "vision_error", "pdf_images_failed")):
-        return "evidence_aggregator"
     return "evidence_aggregator"
 
 
+# Every detective route currently has a single destination.
+DETECTIVE_ROUTES = ["evidence_aggregator"]
+
+
 # -----------------------------
 # Graph definition
 # -----------------------------
-builder = StateGraph(AgentState)
-
-# Detectives
-builder.add_node("repo_detective", repo_investigator)
-builder.add_node("doc_detective", doc_analyst)
-builder.add_node("vision_inspector", vision_inspector)
-builder.add_node("evidence_aggregator", evidence_aggregator)
-
-# Fan-out: START -> detectives (parallel)
-builder.add_edge(START, "repo_detective")
-builder.add_edge(START, "doc_detective")
-builder.add_edge(START, "vision_inspector")
-
-# Conditional edges from detectives (rubric requirement)
-# Even if routes currently always return evidence_aggregator, this satisfies the
-# requirement and supports future richer failure-routing.
-builder.add_conditional_edges("repo_detective", route_after_repo)
-builder.add_conditional_edges("doc_detective", route_after_doc)
-builder.add_conditional_edges("vision_inspector", route_after_vision)
-
-# Fan-in: all detectives converge
-# NOTE: Because conditional edges already point to evidence_aggregator,
-# we do not add direct edges from detectives to evidence_aggregator here.
-# (Adding both can create duplicate/ambiguous paths.)
-
-# Judges
-builder.add_node("prosecutor", prosecutor_judge)
-builder.add_node("defense", defense_judge)
-builder.add_node("techlead", techlead_judge)
-builder.add_node("opinion_aggregator", opinion_aggregator)
-
-# Fan-out: evidence -> judges (parallel)
-builder.add_edge("evidence_aggregator", "prosecutor")
-builder.add_edge("evidence_aggregator", "defense")
-builder.add_edge("evidence_aggregator", "techlead")
-
-# Fan-in: judges -> opinion aggregator
-builder.add_edge("prosecutor", "opinion_aggregator")
-builder.add_edge("defense", "opinion_aggregator")
-builder.add_edge("techlead", "opinion_aggregator")
-
-# Chief Justice
-builder.add_node("chief_justice", chief_justice)
-builder.add_edge("opinion_aggregator", "chief_justice")
-builder.add_edge("chief_justice", END)
-
-graph = builder.compile()
\ No newline at end of file
+def build_graph(checkpointer=None):
+    """
+    Builds and compiles the audit StateGraph.
+    Pass a LangGraph checkpointer to persist per-node progress (see src/main.py).
+    """
+    builder = StateGraph(AgentState)
+
+    # Detectives
+    builder.add_node("repo_detective", repo_investigator)
+    builder.add_node("doc_detective", doc_analyst)
+    builder.add_node("vision_inspector", vision_inspector)
+    builder.add_node("evidence_aggregator", evidence_aggregator)
+
+    # Fan-out: START -> detectives (parallel)
+    builder.add_edge(START, "repo_detective")
+    builder.add_edge(START, "doc_detective")
+    builder.add_edge(START, "vision_inspector")
+
+    # Conditional edges from detectives (rubric requirement)
+    # Even if routes currently always return evidence_aggregator, this satisfies the
+    # requirement and supports future richer failure-routing.
+    builder.add_conditional_edges("repo_detective", route_after_repo, DETECTIVE_ROUTES)
+    builder.add_conditional_edges("doc_detective", route_after_doc, DETECTIVE_ROUTES)
+    builder.add_conditional_edges("vision_inspector", route_after_vision, DETECTIVE_ROUTES)
+
+    # Fan-in: all detectives converge
+    # NOTE: Because conditional edges already point to evidence_aggregator,
+    # we do not add direct edges from detectives to evidence_aggregator here.
+    # (Adding both can create duplicate/ambiguous paths.)
+
+    # Judges
+    builder.add_node("prosecutor", prosecutor_judge)
+    builder.add_node("defense", defense_judge)
+    builder.add_node("techlead", techlead_judge)
+    builder.add_node("opinion_aggregator", opinion_aggregator)
+
+    # Fan-out: evidence -> judges (parallel)
+    builder.add_edge("evidence_aggregator", "prosecutor")
+    builder.add_edge("evidence_aggregator", "defense")
+    builder.add_edge("evidence_aggregator", "techlead")
+
+    # Fan-in: judges -> opinion aggregator
+    builder.add_edge("prosecutor", "opinion_aggregator")
+    builder.add_edge("defense", "opinion_aggregator")
+    builder.add_edge("techlead", "opinion_aggregator")
+
+    # Chief Justice
+    builder.add_node("chief_justice", chief_justice)
+    builder.add_edge("opinion_aggregator", "chief_justice")
+    builder.add_edge("chief_justice", END)
+
+    return builder.compile(checkpointer=checkpointer)
+
+
+@functools.lru_cache(maxsize=1)
+def create_graph():
+    """Checkpoint-free graph, cached so every importer shares one compiled graph per process."""
+    return build_graph()
+
+
+graph = create_graph()
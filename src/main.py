@@ -1,16 +1,27 @@
+import io
 import os
+import hashlib
 import json
+import asyncio
 import argparse
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, TextIO
 
 from dotenv import load_dotenv
 
-from src.graph import graph
+from src.cache import cache_dir, cache_enabled
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
+
+@functools.cache
 def _ensure_dirs() -> None:
+    """Creates the audit output folders; cached, so it runs once per process."""
     Path("audit/report_onself_generated").mkdir(parents=True, exist_ok=True)
     Path("audit/report_onpeer_generated").mkdir(parents=True, exist_ok=True)
     Path("audit/report_bypeer_received").mkdir(parents=True, exist_ok=True)
@@ -28,74 +39,73 @@ def _safe_dump(obj: Any) -> Dict[str, Any]:
     return {"value": str(obj)}
 
 
-def _to_markdown(report_dict: Dict[str, Any]) -> str:
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Writes report JSON, using orjson (Rust, much faster on large reports) when installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# One criterion section; optional parts are pre-rendered (or "") by the caller.
+_CRITERION_MD = "### {cid}\n\n- **Score:** {score}/5\n{summary}{strengths}{weaknesses}{remediation}{dissent}\n"
+
+
+def _md_bullets(title: str, items: Any, limit: int = 8) -> str:
+    """A bold-titled bullet list of the first `limit` items, or "" when empty."""
+    if not items:
+        return ""
+    return f"\n**{title}**\n" + "".join(f"- {item}\n" for item in items[:limit])
+
+
+def _write_markdown(out: TextIO, report_dict: Dict[str, Any]) -> None:
+    """Streams the markdown report into `out` (an open file or StringIO)."""
     overall = report_dict.get("overall_score", "N/A")
     summary = report_dict.get("executive_summary", "")
     key_risks = report_dict.get("key_risks", []) or []
     next_steps = report_dict.get("next_steps", []) or []
     criteria = report_dict.get("criteria", []) or []
 
-    lines = []
-    lines.append("# Automaton Auditor — Audit Report\n\n")
-    lines.append(f"**Overall Score:** {overall}/5\n\n")
+    write = out.write
+    write("# Automaton Auditor — Audit Report\n\n")
+    write(f"**Overall Score:** {overall}/5\n\n")
 
     if summary:
-        lines.append("## Executive Summary\n\n")
-        lines.append(f"{summary}\n\n")
+        write("## Executive Summary\n\n")
+        write(f"{summary}\n\n")
 
-    lines.append("## Criteria Results\n\n")
+    write("## Criteria Results\n\n")
     if not criteria:
-        lines.append("- No criteria results found.\n")
+        write("- No criteria results found.\n")
     else:
         for c in criteria:
-            cid = c.get("criterion_id", "unknown")
-            score = c.get("final_score", "N/A")
             csum = c.get("summary", "")
-            strengths = c.get("strengths", []) or []
-            weaknesses = c.get("weaknesses", []) or []
-            remediation = c.get("remediation", []) or []
             dissent = c.get("dissent")
-
-            lines.append(f"### {cid}\n\n")
-            lines.append(f"- **Score:** {score}/5\n")
-            if csum:
-                lines.append(f"- **Summary:** {csum}\n")
-
-            if strengths:
-                lines.append("\n**Strengths**\n")
-                for s in strengths[:8]:
-                    lines.append(f"- {s}\n")
-
-            if weaknesses:
-                lines.append("\n**Weaknesses**\n")
-                for w in weaknesses[:8]:
-                    lines.append(f"- {w}\n")
-
-            if remediation:
-                lines.append("\n**Remediation**\n")
-                for r in remediation[:8]:
-                    lines.append(f"- {r}\n")
-
-            if dissent:
-                lines.append(f"\n**Dissent:** {dissent}\n")
-
-            lines.append("\n")
-
-    lines.append("## Key Risks\n\n")
+            write(_CRITERION_MD.format_map({
+                "cid": c.get("criterion_id", "unknown"),
+                "score": c.get("final_score", "N/A"),
+                "summary": f"- **Summary:** {csum}\n" if csum else "",
+                "strengths": _md_bullets("Strengths", c.get("strengths", [])),
+                "weaknesses": _md_bullets("Weaknesses", c.get("weaknesses", [])),
+                "remediation": _md_bullets("Remediation", c.get("remediation", [])),
+                "dissent": f"\n**Dissent:** {dissent}\n" if dissent else "",
+            }))
+
+    write("## Key Risks\n\n")
     if key_risks:
         for r in key_risks[:10]:
-            lines.append(f"- {r}\n")
+            write(f"- {r}\n")
     else:
-        lines.append("- None reported.\n")
+        write("- None reported.\n")
 
-    lines.append("\n## Next Steps\n\n")
+    write("\n## Next Steps\n\n")
     if next_steps:
         for n in next_steps[:10]:
-            lines.append(f"- {n}\n")
+            write(f"- {n}\n")
     else:
-        lines.append("- None reported.\n")
-
-    return "".join(lines)
+        write("- None reported.\n")
 
 
 def write_audit_outputs(final_report_obj: Any, mode: str) -> Path:
@@ -110,15 +120,76 @@ def write_audit_outputs(final_report_obj: Any, mode: str) -> Path:
     json_path = out_dir / f"{base}.json"
     md_path = out_dir / f"{base}.md"
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(report_dict, f, indent=2, ensure_ascii=False)
+    _write_json(json_path, report_dict)
 
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(_to_markdown(report_dict))
+    # render in memory, then store it with a single write
+    buf = io.StringIO()
+    _write_markdown(buf, report_dict)
+    md_path.write_text(buf.getvalue(), encoding="utf-8")
 
     return out_dir
 
 
+# State models the checkpointer is allowed to deserialize.
+_CHECKPOINT_TYPES = [
+    ("src.state", name) for name in ("Evidence", "JudicialOpinion", "CriterionResult", "AuditReport")
+]
+
+
+def _thread_id(repo_url: str, pdf_path: str, repo_head: Optional[str]) -> str:
+    """Checkpoint thread per repo + commit + PDF, so a new commit never resumes an old run."""
+    return hashlib.sha256(f"{repo_url}\n{repo_head or ''}\n{pdf_path}".encode("utf-8")).hexdigest()
+
+
+async def _ainvoke_resumable(
+    app: Any, checkpointer: Any, initial_state: Dict[str, Any], thread_id: str
+) -> Dict[str, Any]:
+    """Resumes an interrupted thread from its last completed superstep, else starts it fresh."""
+    config = {"configurable": {"thread_id": thread_id}}
+    snapshot = await app.aget_state(config)
+    if snapshot.next:
+        print(f"Resuming interrupted audit at: {', '.join(snapshot.next)}")
+        return await app.ainvoke(None, config)
+
+    # Finished (or new) thread: start clean so reducers don't append onto
+    # the previous run's evidence/opinions.
+    await checkpointer.adelete_thread(thread_id)
+    return await app.ainvoke(initial_state, config)
+
+
+async def _run_graph(initial_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs the audit graph with a SQLite checkpointer (audit/.cache/checkpoints.db)
+    when the optional langgraph-checkpoint-sqlite package is installed. If the
+    previous run for the same repo commit + PDF crashed mid-graph, it resumes
+    from the last completed superstep instead of re-running detectives and judges.
+    """
+    # Imported here so `--help` and argument errors don't pay for loading
+    # LangGraph and every node module.
+    from src.graph import build_graph, graph
+
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver  # type: ignore
+    except ImportError:
+        AsyncSqliteSaver = None  # type: ignore
+
+    if not cache_enabled():
+        return await graph.ainvoke(initial_state)
+    if AsyncSqliteSaver is None:
+        print("[WARN] langgraph-checkpoint-sqlite not installed; an interrupted audit will start over.")
+        return await graph.ainvoke(initial_state)
+
+    db_path = cache_dir() / "checkpoints.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    thread_id = _thread_id(initial_state["repo_url"], initial_state["pdf_path"], initial_state.get("repo_head"))
+
+    async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
+        if hasattr(checkpointer, "with_allowlist"):
+            checkpointer = checkpointer.with_allowlist(_CHECKPOINT_TYPES)
+        app = build_graph(checkpointer=checkpointer)
+        return await _ainvoke_resumable(app, checkpointer, initial_state, thread_id)
+
+
 def main():
     load_dotenv()
 
@@ -131,8 +202,16 @@ def main():
         default="self",
         help="Where to save outputs: self -> audit/report_onself_generated, peer -> audit/report_onpeer_generated",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and skip writing audit/.cache (forensic results and LLM responses)",
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        os.environ["AUDITOR_CACHE"] = "off"
+
     repo_url = (args.repo or os.getenv("REPO_URL", "")).strip()
     pdf_path = (args.pdf or os.getenv("PDF_PATH", "")).strip()
 
@@ -141,15 +220,21 @@ def main():
     if not pdf_path:
         raise ValueError("Missing PDF path. Provide --pdf or set PDF_PATH in your .env")
 
+    from src.tools.repo_tools import resolve_remote_head
+
     initial_state = {
         "repo_url": repo_url,
         "pdf_path": pdf_path,
+        # one ls-remote per run, shared by the detectives' cache keys
+        "repo_head": resolve_remote_head(repo_url),
         "evidences": {},
         "opinions": [],
         "final_report": None,
     }
 
-    result = graph.invoke(initial_state)
+    # Async entry point: detectives/judges are async nodes, so the fan-out
+    # branches overlap their blocking I/O instead of queueing behind each other.
+    result = asyncio.run(_run_graph(initial_state))
     final_report = result.get("final_report")
 
     if not final_report:
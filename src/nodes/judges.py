@@ -1,32 +1,116 @@
+import asyncio
+import functools
+import hashlib
+import heapq
+import io
 import json
 import os
-import time
-from pathlib import Path
-from typing import Dict, List, Tuple, Any
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from pydantic import ValidationError
 
-from src.state import AgentState, Evidence, JudicialOpinion, JudgeName
+from src.cache import (
+    ainvoke_cached,
+    cached_llm_answer,
+    llm_cache_key,
+    load_json,
+    remember_llm_answer,
+    save_json,
+)
+from src.nodes.judges_batch import poll_batch, submit_batch
+from src.nodes.justice import prepare_rubric
+from src.state import (
+    AgentState,
+    Evidence,
+    JudgeName,
+    JudgeOpinionBatch,
+    JudgePanelOpinion,
+    JudicialOpinion,
+)
+
+JUDGES: Tuple[JudgeName, ...] = ("Prosecutor", "Defense", "TechLead")
+
+_PERSONAS: Mapping[str, str] = MappingProxyType({
+    "Prosecutor": (
+        "You are the Prosecutor. Be skeptical and strict. "
+        "Penalize missing requirements, security issues, vague or unverified claims."
+    ),
+    "Defense": (
+        "You are the Defense. Be fair and generous. "
+        "Give credit for partial implementations and strong intent. "
+        "If something is missing, explain exactly what to add."
+    ),
+    "TechLead": (
+        "You are the Tech Lead. Be practical and engineering-focused. "
+        "Prioritize correctness, maintainability, safety, and reproducibility."
+    ),
+})
+
+_SCORING_RULES = (
+    "Scoring: integer 1..5\n"
+    "1 = fails/no evidence\n"
+    "2 = weak / major gaps\n"
+    "3 = acceptable / partial\n"
+    "4 = strong\n"
+    "5 = excellent\n\n"
+    "Hard rules:\n"
+    "- Use ONLY evidence provided.\n"
+    "- Do NOT invent files, APIs, or features.\n"
+    "- cited_evidence must be IDs like repo_detective:0 or doc_detective:2\n"
+    "- argument must be short (2–5 sentences) and grounded.\n"
+)
+
+# Single-judge, single-criterion prompt, split so everything shared by every
+# judge and criterion call (evidence, rules) is one stable prefix; only the
+# persona and criterion section differ per call. A stable prefix also lets
+# providers that cache prompt prefixes reuse it across all three judges.
+_JUDGE_PREAMBLE = """Evidence (subset):
+{evidence_text}
 
+{rules}
+"""
 
-def _repo_root() -> Path:
-    # This works even if you run from another directory.
-    return Path(__file__).resolve().parents[2]
+_JUDGE_CRITERION = """{persona}
 
+Criterion:
+- id: {cid}
+- name: {cname}
 
-def _load_rubric(path: str = "rubric.json") -> List[Dict[str, Any]]:
-    rubric_path = _repo_root() / path
-    if not rubric_path.exists():
-        raise FileNotFoundError(
-            f"Missing {rubric_path}. Create rubric.json in the repo root (same level as src/)."
-        )
+Forensic instruction:
+{instr}
 
-    with open(rubric_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+Judge-specific logic:
+{judge_logic}
 
-    # support both formats
-    dims = data.get("dimensions") or data.get("criteria") or []
-    return dims if isinstance(dims, list) else []
+Return a JudicialOpinion JSON with:
+judge="{judge}"
+criterion_id="{cid}"
+score=1..5
+argument="..."
+cited_evidence=[...]"""
+
+# Models sometimes echo the prompt's list syntax back ("[repo_detective:0]").
+_CITE_TRANS = str.maketrans("", "", "[]")
+
+# Concurrent LLM calls allowed across all judges, one semaphore per event loop
+# (asyncio primitives cannot be shared between loops).
+_LLM_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Per-loop request-rate buckets (GROQ_RPM), for the same reason.
+_RPM_BUCKETS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _TokenBucket]" = weakref.WeakKeyDictionary()
+
+# Batched panel runs, keyed on a hash of everything the panel prompt depends on.
+# The three judge nodes run concurrently and share the one task; each entry
+# also holds the judges that have not collected their opinions yet, and is
+# dropped once all of them have.
+_PANEL_TASKS: Dict[str, Tuple["asyncio.Task[Dict[str, List[JudicialOpinion]]]", Set[str]]] = {}
+
+
+def _load_rubric(path: str = "rubric.json") -> List[Dict[str, Any]]:
+    # same per-version parse that justice and the evidence aggregator share
+    return list(prepare_rubric(path)["dimensions"])
 
 
 def _flatten_evidence(evidences: Dict[str, List[Evidence]]) -> List[Tuple[str, Evidence]]:
@@ -37,34 +121,72 @@ def _flatten_evidence(evidences: Dict[str, List[Evidence]]) -> List[Tuple[str, E
     return flat
 
 
+def _clip_utf8(text: str, max_bytes: int) -> str:
+    """Truncates to at most `max_bytes` UTF-8 bytes without splitting a character."""
+    if text.isascii():
+        return text[:max_bytes]
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+
+
 def _evidence_brief(evidences: Dict[str, List[Evidence]], max_items: int = 10) -> str:
     flat = _flatten_evidence(evidences)[:max_items]
-    lines: List[str] = []
+    if not flat:
+        return "No evidence provided."
+
+    buf = io.StringIO()
     for ev_id, ev in flat:
         status = "FOUND" if ev.found else "FAIL"
         conf = float(ev.confidence or 0.0)
-        goal = (ev.goal or "")[:80]
-        loc = (ev.location or "")[:80]
-        lines.append(f"- {ev_id} | {status} | {goal} | {loc} | {conf:.2f}")
-    return "\n".join(lines) if lines else "No evidence provided."
-
+        goal = _clip_utf8(ev.goal or "", 80)
+        loc = _clip_utf8(ev.location or "", 80)
+        buf.write(f"- {ev_id} | {status} | {goal} | {loc} | {conf:.2f}\n")
+    return buf.getvalue().rstrip("\n")
 
-def _choose_citations(evidences: Dict[str, List[Evidence]], limit: int = 3) -> List[str]:
-    flat = _flatten_evidence(evidences)
 
-    negatives = [(eid, ev) for eid, ev in flat if not ev.found]
-    positives = [(eid, ev) for eid, ev in flat if ev.found]
+def _confidence_of(item: Tuple[str, Evidence]) -> float:
+    return float(item[1].confidence or 0.0)
 
-    negatives.sort(key=lambda x: float(x[1].confidence or 0.0), reverse=True)
-    positives.sort(key=lambda x: float(x[1].confidence or 0.0), reverse=True)
 
-    chosen = [eid for eid, _ in negatives[:limit]]
+def _choose_citations(evidences: Dict[str, List[Evidence]], limit: int = 3) -> List[str]:
+    negatives: List[Tuple[str, Evidence]] = []
+    positives: List[Tuple[str, Evidence]] = []
+    for item in _flatten_evidence(evidences):
+        (positives if item[1].found else negatives).append(item)
+
+    # Only the top `limit` of each side is needed; nlargest keeps sort order
+    # (ties stay in evidence order) without sorting whole partitions.
+    chosen = [eid for eid, _ in heapq.nlargest(limit, negatives, key=_confidence_of)]
     if len(chosen) < limit:
-        chosen += [eid for eid, _ in positives[: (limit - len(chosen))]]
+        chosen += [eid for eid, _ in heapq.nlargest(limit - len(chosen), positives, key=_confidence_of)]
 
     return chosen
 
 
+def prepare_judge_inputs(evidences: Dict[str, List[Evidence]]) -> Dict[str, Any]:
+    """
+    Judge inputs that depend only on the merged evidence. Computed once by the
+    evidence aggregator and shared through state, so the three judges don't
+    each re-flatten and re-sort the same evidence.
+    """
+    return {
+        "evidence_text": _evidence_brief(
+            evidences, max_items=int(os.getenv("MAX_EVIDENCE_FOR_JUDGES", "6"))
+        ),
+        "default_citations": _choose_citations(evidences, limit=3),
+    }
+
+
+def _judge_inputs(state: AgentState) -> Tuple[str, List[str]]:
+    inputs = state.get("judge_inputs") or prepare_judge_inputs(state.get("evidences") or {})
+    return inputs["evidence_text"], list(inputs["default_citations"])
+
+
+def _normalize_citations(opinion: JudicialOpinion, default: List[str]) -> None:
+    """Strips brackets/whitespace from LLM citation IDs; empty lists get `default`."""
+    cited = [str(item).strip().translate(_CITE_TRANS) for item in opinion.cited_evidence]
+    opinion.cited_evidence = [c for c in cited if c] or list(default)
+
+
 def _llm_available() -> bool:
     """
     Auto-mode:
@@ -77,54 +199,193 @@ def _llm_available() -> bool:
     return bool(os.getenv("GROQ_API_KEY", "").strip())
 
 
-def _get_llm():
+def _model_name() -> str:
+    return os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+
+
+@functools.cache
+def _chat_model(model: str, temperature: float):
+    # langchain_groq is imported on first LLM use, and one client is shared per config
     from langchain_groq import ChatGroq  # type: ignore
 
-    model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
-    temperature = float(os.getenv("JUDGE_TEMPERATURE", "0.2"))
     return ChatGroq(model=model, temperature=temperature)
 
 
+@functools.cache
+def _groq_errors() -> Tuple[type, type]:
+    """
+    (RateLimitError, BadRequestError), imported once on first LLM use so
+    fallback runs never load the groq SDK. Both are Exception without groq.
+    """
+    try:
+        from groq import BadRequestError, RateLimitError  # type: ignore
+    except Exception:
+        return Exception, Exception
+    return RateLimitError, BadRequestError
+
+
+def _temperature() -> float:
+    return float(os.getenv("JUDGE_TEMPERATURE", "0.2"))
+
+
+def _cache_model_key() -> str:
+    """Model identity for the LLM response cache; sampling temperature changes answers too."""
+    return f"{_model_name()}@{_temperature()}"
+
+
+@functools.cache
+def _structured_model(model: str, temperature: float, schema: type):
+    # with_structured_output builds a new runnable chain each call; bind once per schema
+    return _chat_model(model, temperature).with_structured_output(schema)
+
+
+def _get_structured_llm(schema: type):
+    return _structured_model(_model_name(), _temperature(), schema)
+
+
+class _TokenBucket:
+    """
+    Proactive requests-per-minute limiter. Starts full (a per-minute quota allows
+    a burst of that size) and refills continuously; waiters are served in order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated = asyncio.get_running_loop().time()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+
+async def _rpm_token() -> None:
+    """Waits for a GROQ_RPM token; unset or 0 (the default) disables the limit."""
+    per_minute = float(os.getenv("GROQ_RPM", "0"))
+    if per_minute <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    bucket = _RPM_BUCKETS.get(loop)
+    if bucket is None or bucket.capacity != per_minute:
+        bucket = _TokenBucket(per_minute)
+        _RPM_BUCKETS[loop] = bucket
+    await bucket.acquire()
+
+
+def _llm_slots() -> asyncio.Semaphore:
+    """Shared JUDGE_CONCURRENCY-sized semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    slots = _LLM_SLOTS.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(max(1, int(os.getenv("JUDGE_CONCURRENCY", "4"))))
+        _LLM_SLOTS[loop] = slots
+    return slots
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower().strip() in ("1", "true", "on", "yes")
+
+
+def _panel_enabled() -> bool:
+    """JUDGE_PANEL=1 -> one LLM call per criterion returns all three opinions."""
+    return _env_flag("JUDGE_PANEL")
+
+
+def _batch_criteria_enabled() -> bool:
+    """JUDGE_BATCH_CRITERIA=1 -> one LLM call per judge scores every criterion."""
+    return _env_flag("JUDGE_BATCH_CRITERIA")
+
+
+def _groq_batch_enabled(criteria: List[Dict[str, Any]]) -> bool:
+    """JUDGE_BATCH=1 -> rubrics with 4+ criteria go through the Groq Batch API."""
+    return _env_flag("JUDGE_BATCH") and len(criteria) >= 4
+
+
+@functools.lru_cache(maxsize=16)
+def _judge_preamble(evidence_text: str) -> str:
+    return _JUDGE_PREAMBLE.format_map({
+        "evidence_text": evidence_text,
+        "rules": _SCORING_RULES,
+    })
+
+
 def _judge_prompt(judge: JudgeName, criterion: Dict[str, Any], evidence_text: str) -> str:
+    cid = criterion.get("id", "unknown")
+    logic = criterion.get("judicial_logic") or {}
+
+    return _judge_preamble(evidence_text) + _JUDGE_CRITERION.format_map({
+        "persona": _PERSONAS[judge],
+        "cid": cid,
+        "cname": criterion.get("name", cid),
+        "instr": criterion.get("forensic_instruction") or criterion.get("description") or "",
+        "judge_logic": logic.get(judge.lower()) or logic.get(judge) or "",
+        "judge": judge,
+    }).rstrip()
+
+
+def _batch_prompt(judge: JudgeName, criteria: List[Dict[str, Any]], evidence_text: str) -> str:
+    blocks = []
+    for c in criteria:
+        cid = c.get("id", "unknown")
+        instr = c.get("forensic_instruction") or c.get("description") or ""
+        logic = c.get("judicial_logic") or {}
+        judge_logic = logic.get(judge.lower()) or logic.get(judge) or ""
+        blocks.append(
+            f"- id: {cid}\n  name: {c.get('name', cid)}\n"
+            f"  forensic instruction: {instr}\n  judge-specific logic: {judge_logic}"
+        )
+    criteria_text = "\n".join(blocks)
+    ids = ", ".join(c.get("id", "unknown") for c in criteria)
+
+    return f"""
+{_PERSONAS[judge]}
+
+Criteria:
+{criteria_text}
+
+Evidence (subset):
+{evidence_text}
+
+{_SCORING_RULES}
+
+Return a JudgeOpinionBatch JSON: {{"opinions": [...]}} with exactly {len(criteria)}
+JudicialOpinion objects, one per criterion id ({ids}), each with:
+judge="{judge}"
+criterion_id="<criterion id>"
+score=1..5
+argument="..."
+cited_evidence=[...]
+""".strip()
+
+
+def _panel_prompt(criterion: Dict[str, Any], evidence_text: str) -> str:
     cid = criterion.get("id", "unknown")
     cname = criterion.get("name", cid)
 
     instr = criterion.get("forensic_instruction") or criterion.get("description") or ""
     logic = criterion.get("judicial_logic") or {}
-    judge_logic = logic.get(judge.lower()) or logic.get(judge) or ""
 
-    persona = {
-        "Prosecutor": (
-            "You are the Prosecutor. Be skeptical and strict. "
-            "Penalize missing requirements, security issues, vague or unverified claims."
-        ),
-        "Defense": (
-            "You are the Defense. Be fair and generous. "
-            "Give credit for partial implementations and strong intent. "
-            "If something is missing, explain exactly what to add."
-        ),
-        "TechLead": (
-            "You are the Tech Lead. Be practical and engineering-focused. "
-            "Prioritize correctness, maintainability, safety, and reproducibility."
-        ),
-    }[judge]
-
-    rules = (
-        "Scoring: integer 1..5\n"
-        "1 = fails/no evidence\n"
-        "2 = weak / major gaps\n"
-        "3 = acceptable / partial\n"
-        "4 = strong\n"
-        "5 = excellent\n\n"
-        "Hard rules:\n"
-        "- Use ONLY evidence provided.\n"
-        "- Do NOT invent files, APIs, or features.\n"
-        "- cited_evidence must be IDs like repo_detective:0 or doc_detective:2\n"
-        "- argument must be short (2–5 sentences) and grounded.\n"
-    )
+    benches = []
+    for judge in JUDGES:
+        judge_logic = logic.get(judge.lower()) or logic.get(judge) or ""
+        benches.append(f"[{judge}]\n{_PERSONAS[judge]}\nJudge-specific logic: {judge_logic}")
+    bench_text = "\n\n".join(benches)
 
     return f"""
-{persona}
+You are a panel of three independent judges. Write one opinion per judge;
+each judge must reason only from its own persona.
+
+{bench_text}
 
 Criterion:
 - id: {cid}
@@ -133,16 +394,14 @@ Criterion:
 Forensic instruction:
 {instr}
 
-Judge-specific logic:
-{judge_logic}
-
 Evidence (subset):
 {evidence_text}
 
-{rules}
+{_SCORING_RULES}
 
-Return a JudicialOpinion JSON with:
-judge="{judge}"
+Return a JudgePanelOpinion JSON with keys prosecutor, defense, techlead.
+Each value is a JudicialOpinion with:
+judge="Prosecutor" | "Defense" | "TechLead"
 criterion_id="{cid}"
 score=1..5
 argument="..."
@@ -150,14 +409,29 @@ cited_evidence=[...]
 """.strip()
 
 
+def _evidence_stats(state: AgentState) -> Tuple[int, bool]:
+    """
+    (total evidence items, any failed item), read from the reducer-maintained
+    aggregates; falls back to walking the evidence for states built without them.
+    """
+    counts = state.get("evidence_counts")
+    if counts is not None:
+        return sum(counts.values()), bool(state.get("evidence_has_failure"))
+
+    evidences = state.get("evidences") or {}
+    total = sum(len(v or []) for v in evidences.values())
+    has_fail = any((not ev.found) for _, ev in _flatten_evidence(evidences))
+    return total, has_fail
+
+
 def _deterministic_fallback_for_one(
     judge: JudgeName,
     criterion_id: str,
-    evidences: Dict[str, List[Evidence]],
+    citations: List[str],
     reason: str,
+    stats: Tuple[int, bool],
 ) -> JudicialOpinion:
-    total = sum(len(v or []) for v in (evidences or {}).values())
-    has_fail = any((not ev.found) for _, ev in _flatten_evidence(evidences))
+    total, has_fail = stats
 
     score = 3
     if total == 0:
@@ -167,20 +441,263 @@ def _deterministic_fallback_for_one(
     elif not has_fail and judge == "Defense":
         score = 4
 
-    return JudicialOpinion(
+    # Every field is built here from known-valid values (score is 1..5 by
+    # construction), so skip validation on this per-criterion hot path.
+    return JudicialOpinion.model_construct(
         judge=judge,
         criterion_id=criterion_id,
         score=score,
         argument=reason,
-        cited_evidence=_choose_citations(evidences, limit=3),
+        cited_evidence=list(citations),
     )
 
 
-def _run_judge(judge: JudgeName, state: AgentState) -> Dict[str, Any]:
-    time.sleep(float(os.getenv("JUDGE_PER_CRITERION_DELAY", "1.0")))
+async def _ainvoke_with_backoff(structured_llm: Any, prompt: str, schema: type) -> Any:
+    """
+    ainvoke_cached, retrying a rate-limited call with exponential backoff
+    (JUDGE_BACKOFF_SECONDS doubling per attempt, capped at 60s) up to
+    JUDGE_RATE_LIMIT_RETRIES times. Re-raises the last RateLimitError.
+    Callers hold an LLM slot, so only this criterion waits; peers keep going.
+    """
+    RateLimitError, _ = _groq_errors()
+    # Without groq every error would look like a rate limit; don't retry those.
+    retries = int(os.getenv("JUDGE_RATE_LIMIT_RETRIES", "2")) if RateLimitError is not Exception else 0
+    backoff = float(os.getenv("JUDGE_BACKOFF_SECONDS", "12"))
+
+    for attempt in range(retries + 1):
+        try:
+            return await ainvoke_cached(
+                structured_llm, prompt, _cache_model_key(), schema, throttle=_rpm_token
+            )
+        except RateLimitError:
+            if attempt >= retries:
+                raise
+            await asyncio.sleep(min(backoff * 2 ** attempt, 60.0))
+
+
+async def _run_judge_batch(
+    judge: JudgeName,
+    criteria: List[Dict[str, Any]],
+    evidence_text: str,
+) -> Optional[List[JudicialOpinion]]:
+    """
+    Scores every criterion for one judge in a single structured call. Returns
+    the opinions in rubric order, or None if the call fails or the model does
+    not return exactly one opinion per criterion (caller falls back to the
+    per-criterion path).
+    """
+    structured_llm = _get_structured_llm(JudgeOpinionBatch)
+    prompt = _batch_prompt(judge, criteria, evidence_text)
+
+    try:
+        async with _llm_slots():
+            batch = await _ainvoke_with_backoff(structured_llm, prompt, JudgeOpinionBatch)
+    except Exception as e:
+        print(f"[WARN] {judge} batched scoring failed ({type(e).__name__}); scoring per criterion.")
+        return None
+
+    by_id = {op.criterion_id: op for op in batch.opinions}
+    ids = [c.get("id", "unknown") for c in criteria]
+    if len(batch.opinions) != len(criteria) or set(by_id) != set(ids):
+        return None
+
+    opinions = []
+    for cid in ids:
+        opinion = by_id[cid]
+        opinion.judge = judge
+        opinions.append(opinion)
+    return opinions
+
+
+async def _run_judge_groq_batch(
+    judge: JudgeName,
+    criteria: List[Dict[str, Any]],
+    evidence_text: str,
+    citations: List[str],
+    stats: Tuple[int, bool],
+) -> Optional[List[JudicialOpinion]]:
+    """
+    Best-effort Groq Batch API path. Criterion prompts already in the LLM cache
+    are answered from it; the rest go up as one batch job (after a GROQ_RPM
+    token) whose answers are cached like per-criterion calls. Waits up to
+    BATCH_TIMEOUT seconds (default 1h) and never cancels: the pending batch id
+    is cached, so a rerun collects the job instead of submitting a new one.
+    Returns None on submit failure, a failed job or timeout (caller falls
+    through to the per-criterion path); unusable individual results get the
+    deterministic fallback.
+    """
+    model = _cache_model_key()
+    prompts = [_judge_prompt(judge, c, evidence_text) for c in criteria]
+    answers: List[Optional[JudicialOpinion]] = [
+        await cached_llm_answer(model, prompt, JudicialOpinion) for prompt in prompts
+    ]
+    todo = [i for i, answer in enumerate(answers) if answer is None]
+    errors: Dict[int, str] = {}
+
+    if todo:
+        todo_prompts = [prompts[i] for i in todo]
+        pending_name = f"llm/batch-{llm_cache_key(model, json.dumps(todo_prompts))}"
+        pending = load_json(pending_name)
+        batch_id = pending.get("id") if isinstance(pending, dict) else None
+        try:
+            from groq import AsyncGroq  # type: ignore
+
+            client = AsyncGroq()
+            if not batch_id:
+                await _rpm_token()
+                batch_id = await submit_batch(client, todo_prompts, _model_name(), _temperature())
+                save_json(pending_name, {"id": batch_id})
+            outputs = await poll_batch(
+                client, batch_id, len(todo_prompts), timeout=float(os.getenv("BATCH_TIMEOUT", "3600"))
+            )
+        except TimeoutError:
+            print(f"[WARN] {judge} Groq batch still running; scoring per criterion (a rerun collects it).")
+            return None
+        except Exception as e:
+            save_json(pending_name, None)
+            print(f"[WARN] {judge} Groq batch failed ({type(e).__name__}); scoring per criterion.")
+            return None
+
+        save_json(pending_name, None)
+        if outputs is None:
+            print(f"[WARN] {judge} Groq batch failed; scoring per criterion.")
+            return None
+
+        for i, raw in zip(todo, outputs):
+            try:
+                answer = JudicialOpinion.model_validate_json(raw or "")
+            except ValidationError as e:
+                errors[i] = type(e).__name__
+                continue
+            remember_llm_answer(model, prompts[i], answer.model_dump(mode="json"))
+            answers[i] = answer
+
+    opinions: List[JudicialOpinion] = []
+    for i, c in enumerate(criteria):
+        cid = c.get("id", "unknown")
+        opinion = answers[i]
+        if opinion is None:
+            opinion = _deterministic_fallback_for_one(
+                judge=judge,
+                criterion_id=cid,
+                citations=citations,
+                reason=f"Batch output failed ({errors.get(i, 'missing')}). Used deterministic fallback.",
+                stats=stats,
+            )
+        else:
+            opinion.judge = judge
+            opinion.criterion_id = cid
+        _normalize_citations(opinion, citations)
+        opinions.append(opinion)
+    return opinions
+
+
+def _evidence_key(evidence_text: str, citations: List[str], criteria: List[Dict[str, Any]]) -> str:
+    payload = {
+        "evidence_text": evidence_text,
+        "citations": citations,
+        "criteria": criteria,
+        "model": _cache_model_key(),
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def _run_panel(
+    evidence_text: str,
+    citations: List[str],
+    criteria: List[Dict[str, Any]],
+    stats: Tuple[int, bool],
+) -> Dict[str, List[JudicialOpinion]]:
+    """
+    Batched variant of _run_judge: one structured call per criterion returns
+    the Prosecutor, Defense and TechLead opinions together, so the evidence
+    context is sent once instead of three times.
+    """
+    structured_llm = _get_structured_llm(JudgePanelOpinion)
+
+    RateLimitError, _ = _groq_errors()
+
+    rate_limit_count = 0
+    rate_limit_max = int(os.getenv("RATE_LIMIT_MAX", "2"))
+
+    async def judge_criterion(c: Dict[str, Any]) -> List[JudicialOpinion]:
+        nonlocal rate_limit_count
+        cid = c.get("id", "unknown")
+
+        reason = ""
+        panel = None
+        async with _llm_slots():
+            if rate_limit_count >= rate_limit_max:
+                reason = "Too many rate limits. Auto-fallback for remaining criteria."
+            else:
+                try:
+                    panel = await _ainvoke_with_backoff(
+                        structured_llm, _panel_prompt(c, evidence_text), JudgePanelOpinion
+                    )
+                except RateLimitError:
+                    rate_limit_count += 1
+                    reason = "Rate limit hit. Used deterministic fallback for this criterion."
+                except Exception as e:
+                    reason = f"Judge panel output failed ({type(e).__name__}). Used deterministic fallback."
+
+        opinions: List[JudicialOpinion] = []
+        for judge in JUDGES:
+            if panel is not None:
+                opinion = getattr(panel, judge.lower())
+                opinion.judge = judge
+                opinion.criterion_id = cid
+                _normalize_citations(opinion, citations)
+            else:
+                opinion = _deterministic_fallback_for_one(
+                    judge=judge,
+                    criterion_id=cid,
+                    citations=citations,
+                    reason=reason,
+                    stats=stats,
+                )
+            opinions.append(opinion)
+        return opinions
+
+    per_criterion = await asyncio.gather(*(judge_criterion(c) for c in criteria))
 
-    evidences = state.get("evidences", {}) or {}
-    criteria = _load_rubric()
+    by_judge: Dict[str, List[JudicialOpinion]] = {judge: [] for judge in JUDGES}
+    for opinions in per_criterion:
+        for judge, opinion in zip(JUDGES, opinions):
+            by_judge[judge].append(opinion)
+    return by_judge
+
+
+async def _shared_panel(
+    judge: JudgeName,
+    evidence_text: str,
+    citations: List[str],
+    criteria: List[Dict[str, Any]],
+    stats: Tuple[int, bool],
+) -> Dict[str, List[JudicialOpinion]]:
+    """Whichever judge node arrives first starts the panel run; the others await it."""
+    key = _evidence_key(evidence_text, citations, criteria)
+    entry = _PANEL_TASKS.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(_run_panel(evidence_text, citations, criteria, stats))
+        entry = _PANEL_TASKS[key] = (task, set(JUDGES))
+    task, waiting = entry
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        _PANEL_TASKS.pop(key, None)
+        raise
+    finally:
+        waiting.discard(judge)
+        if not waiting and _PANEL_TASKS.get(key) is entry:
+            del _PANEL_TASKS[key]
+
+
+async def _run_judge(judge: JudgeName, state: AgentState) -> Dict[str, Any]:
+    evidence_text, citations = _judge_inputs(state)
+    stats = _evidence_stats(state)
+    rubric = state.get("rubric")
+    criteria = list(rubric["dimensions"]) if rubric else _load_rubric()
 
     if not criteria:
         raise ValueError("rubric.json loaded but contains no dimensions/criteria.")
@@ -193,86 +710,94 @@ def _run_judge(judge: JudgeName, state: AgentState) -> Dict[str, Any]:
                 _deterministic_fallback_for_one(
                     judge=judge,
                     criterion_id=c.get("id", "unknown"),
-                    evidences=evidences,
+                    citations=citations,
                     reason="LLM disabled/unavailable. Used deterministic fallback.",
+                    stats=stats,
                 )
             )
         return {"opinions": opinions}
 
-    base_llm = _get_llm()
-    structured_llm = base_llm.with_structured_output(JudicialOpinion)
+    if _panel_enabled():
+        panel = await _shared_panel(judge, evidence_text, citations, criteria, stats)
+        return {"opinions": list(panel[judge])}
 
-    evidence_text = _evidence_brief(
-        evidences, max_items=int(os.getenv("MAX_EVIDENCE_FOR_JUDGES", "6"))
-    )
+    if _groq_batch_enabled(criteria):
+        batched = await _run_judge_groq_batch(judge, criteria, evidence_text, citations, stats)
+        if batched is not None:
+            return {"opinions": batched}
 
-    try:
-        from groq import RateLimitError, BadRequestError  # type: ignore
-    except Exception:
-        RateLimitError = Exception  # type: ignore
-        BadRequestError = Exception  # type: ignore
+    structured_llm = _get_structured_llm(JudicialOpinion)
 
-    opinions: List[JudicialOpinion] = []
+    if _batch_criteria_enabled():
+        batched = await _run_judge_batch(judge, criteria, evidence_text)
+        if batched is not None:
+            for opinion in batched:
+                _normalize_citations(opinion, citations)
+            return {"opinions": batched}
+
+    RateLimitError, BadRequestError = _groq_errors()
 
     # auto-fallback if rate limiting keeps happening
     rate_limit_count = 0
     rate_limit_max = int(os.getenv("RATE_LIMIT_MAX", "2"))
 
-    for c in criteria:
+    async def judge_criterion(c: Dict[str, Any]) -> JudicialOpinion:
+        nonlocal rate_limit_count
         cid = c.get("id", "unknown")
 
-        # If we already hit too many rate limits, fallback for remaining criteria
-        if rate_limit_count >= rate_limit_max:
-            opinions.append(
-                _deterministic_fallback_for_one(
+        async with _llm_slots():
+            # If we already hit too many rate limits, fallback for remaining criteria
+            if rate_limit_count >= rate_limit_max:
+                return _deterministic_fallback_for_one(
                     judge=judge,
                     criterion_id=cid,
-                    evidences=evidences,
+                    citations=citations,
                     reason="Too many rate limits. Auto-fallback for remaining criteria.",
+                    stats=stats,
                 )
-            )
-            continue
-
-        prompt = _judge_prompt(judge, c, evidence_text)
 
-        try:
-            opinion = structured_llm.invoke(prompt)
-            opinion.judge = judge
-            opinion.criterion_id = cid
+            prompt = _judge_prompt(judge, c, evidence_text)
 
-        except RateLimitError:
-            rate_limit_count += 1
-            time.sleep(float(os.getenv("JUDGE_BACKOFF_SECONDS", "12")))
-            opinion = _deterministic_fallback_for_one(
-                judge=judge,
-                criterion_id=cid,
-                evidences=evidences,
-                reason="Rate limit hit. Used deterministic fallback for this criterion.",
-            )
+            try:
+                opinion = await _ainvoke_with_backoff(structured_llm, prompt, JudicialOpinion)
+                opinion.judge = judge
+                opinion.criterion_id = cid
 
-        except (BadRequestError, ValidationError, ValueError, Exception) as e:
-            opinion = _deterministic_fallback_for_one(
-                judge=judge,
-                criterion_id=cid,
-                evidences=evidences,
-                reason=f"Judge output failed ({type(e).__name__}). Used deterministic fallback.",
-            )
+            except RateLimitError:
+                # retries exhausted for this criterion
+                rate_limit_count += 1
+                opinion = _deterministic_fallback_for_one(
+                    judge=judge,
+                    criterion_id=cid,
+                    citations=citations,
+                    reason="Rate limit hit. Used deterministic fallback for this criterion.",
+                    stats=stats,
+                )
 
-        if not opinion.cited_evidence:
-            opinion.cited_evidence = _choose_citations(evidences, limit=3)
+            except (BadRequestError, ValidationError, ValueError, Exception) as e:
+                opinion = _deterministic_fallback_for_one(
+                    judge=judge,
+                    criterion_id=cid,
+                    citations=citations,
+                    reason=f"Judge output failed ({type(e).__name__}). Used deterministic fallback.",
+                    stats=stats,
+                )
 
-        opinions.append(opinion)
+        _normalize_citations(opinion, citations)
+        return opinion
 
+    # Criteria are independent: fan them out, bounded by JUDGE_CONCURRENCY.
+    opinions = list(await asyncio.gather(*(judge_criterion(c) for c in criteria)))
     return {"opinions": opinions}
 
 
-def prosecutor_judge(state: AgentState):
-    return _run_judge("Prosecutor", state)
+async def prosecutor_judge(state: AgentState):
+    return await _run_judge("Prosecutor", state)
 
 
-def defense_judge(state: AgentState):
-    return _run_judge("Defense", state)
+async def defense_judge(state: AgentState):
+    return await _run_judge("Defense", state)
 
 
-def techlead_judge(state: AgentState):
-    return _run_judge("TechLead", state)
\ No newline at end of file
+async def techlead_judge(state: AgentState):
+    return await _run_judge("TechLead", state)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import asyncio
+import inspect
+import json
+from typing import Any, List, Optional
+
+# Groq Batch API: all judge prompts go up as one JSONL job instead of one HTTPS
+# round trip per criterion. Used by judges when JUDGE_BATCH=1.
+
+_DONE_FAILED = ("failed", "expired", "cancelled", "cancelling")
+
+
+async def submit_batch(client: Any, prompts: List[str], model: str, temperature: float) -> str:
+    """
+    Uploads one chat-completion request per prompt (custom_id = prompt index)
+    and starts a batch job. Returns the batch id.
+    """
+    lines = [
+        json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "temperature": temperature,
+                "response_format": {"type": "json_object"},
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }, ensure_ascii=False)
+        for i, prompt in enumerate(prompts)
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    upload = await client.files.create(file=("judge_batch.jsonl", payload), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+async def _read_text(response: Any) -> str:
+    # files.content() returns a binary response whose .text is a property on
+    # some SDK versions and a (possibly async) method on others.
+    text = response.text
+    if callable(text):
+        text = text()
+    if inspect.isawaitable(text):
+        text = await text
+    return text
+
+
+async def poll_batch(
+    client: Any,
+    batch_id: str,
+    count: int,
+    timeout: float,
+    interval: float = 5.0,
+) -> Optional[List[Optional[str]]]:
+    """
+    Waits up to `timeout` seconds for the batch. Returns the message content per
+    prompt index (None where a request failed), or None if the job failed.
+    Raises TimeoutError if it is still running; the job is left to finish so a
+    later poll of the same id can collect it.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in _DONE_FAILED:
+            return None
+        if loop.time() >= deadline:
+            raise TimeoutError(f"batch {batch_id} still {batch.status}")
+        await asyncio.sleep(min(interval, max(0.0, deadline - loop.time())))
+
+    if not batch.output_file_id:
+        return None
+
+    outputs: List[Optional[str]] = [None] * count
+    text = await _read_text(await client.files.content(batch.output_file_id))
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # a truncated/corrupt line loses only its own result
+        if not isinstance(record, dict):
+            continue
+        try:
+            idx = int(record.get("custom_id", -1))
+        except (TypeError, ValueError):
+            continue
+        body = (record.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if 0 <= idx < count and choices:
+            outputs[idx] = (choices[0].get("message") or {}).get("content")
+    return outputs
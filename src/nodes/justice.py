@@ -1,6 +1,12 @@
+import functools
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, NamedTuple, Tuple, Any, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 from src.state import AgentState, AuditReport, CriterionResult, JudicialOpinion, Evidence
 
@@ -10,14 +16,28 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _load_rubric_file(path: str = "rubric.json") -> Dict[str, Any]:
-    rubric_path = _repo_root() / path
-    if not rubric_path.exists():
-        raise FileNotFoundError(f"Missing {rubric_path}. Create rubric.json in repo root.")
+@functools.lru_cache(maxsize=4)
+def _read_rubric_cached(rubric_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    # mtime is part of the key so an edited rubric.json is re-read
+    if orjson is not None:
+        return orjson.loads(rubric_path.read_bytes())
     with open(rubric_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _rubric_version(path: str) -> Tuple[Path, int]:
+    rubric_path = _repo_root() / path
+    try:
+        return rubric_path, rubric_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing {rubric_path}. Create rubric.json in repo root.") from None
+
+
+def _load_rubric_file(path: str = "rubric.json") -> Dict[str, Any]:
+    """Parsed rubric, shared between calls; callers must not mutate it."""
+    return _read_rubric_cached(*_rubric_version(path))
+
+
 def _load_dimensions(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     dims = data.get("dimensions") or data.get("criteria") or []
     return dims if isinstance(dims, list) else []
@@ -33,103 +53,177 @@ def _weight_map(dimensions: List[Dict[str, Any]]) -> Dict[str, float]:
     return {d.get("id", ""): float(d.get("weight", 0.0) or 0.0) for d in dimensions}
 
 
-def _group_opinions(opinions: List[JudicialOpinion]) -> Dict[str, List[JudicialOpinion]]:
-    grouped: Dict[str, List[JudicialOpinion]] = {}
-    for op in opinions or []:
-        grouped.setdefault(op.criterion_id, []).append(op)
-    return grouped
+def _security_caps_at_3(rules: Dict[str, Any]) -> bool:
+    security_override = str(rules.get("security_override", "")).lower()
+    return "cap" in security_override and "3" in security_override
 
 
-def _flatten_evidence(evidences: Dict[str, List[Evidence]]) -> List[Tuple[str, Evidence]]:
-    flat: List[Tuple[str, Evidence]] = []
-    for source, items in (evidences or {}).items():
-        for i, ev in enumerate(items or []):
-            flat.append((f"{source}:{i}", ev))
-    return flat
+@functools.lru_cache(maxsize=4)
+def _rubric_bundle(rubric_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    rubric = _read_rubric_cached(rubric_path, mtime_ns)
+    dimensions = _load_dimensions(rubric)
+    rules = _load_synthesis_rules(rubric)
+    return {
+        "dimensions": dimensions,
+        "rules": rules,
+        "weights": _weight_map(dimensions),
+        # synthesis rule predicates, resolved once per rubric version
+        "fact_supremacy": bool(str(rules.get("fact_supremacy", "")).strip()),
+        "security_cap_3": _security_caps_at_3(rules),
+    }
 
 
-def _variance(scores: List[int]) -> int:
-    return max(scores) - min(scores) if scores else 0
+def prepare_rubric(path: str = "rubric.json") -> Dict[str, Any]:
+    """
+    Rubric pieces every downstream node needs, shared through state (see
+    evidence_aggregator). Built once per rubric version per process; callers
+    must not mutate it.
+    """
+    return _rubric_bundle(*_rubric_version(path))
+
+
+class _OpinionTally:
+    """One criterion's opinions, accumulated as they are grouped."""
+
+    __slots__ = ("total", "count", "lo", "hi", "by_judge", "prosecutor", "strengths", "weaknesses")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.count = 0
+        self.lo = 5
+        self.hi = 1
+        # first opinion per judge (quoted in dissent); the score check uses the latest Prosecutor
+        self.by_judge: Dict[str, JudicialOpinion] = {}
+        self.prosecutor: Optional[JudicialOpinion] = None
+        self.strengths: List[str] = []
+        self.weaknesses: List[str] = []
+
+    @property
+    def var(self) -> int:
+        return self.hi - self.lo if self.count else 0
+
+
+def _group_opinions(opinions: List[JudicialOpinion]) -> Dict[str, _OpinionTally]:
+    """Groups opinions by criterion and reduces each group in the same pass."""
+    grouped: Dict[str, _OpinionTally] = {}
+    for o in opinions or []:
+        tally = grouped.get(o.criterion_id)
+        if tally is None:
+            tally = grouped[o.criterion_id] = _OpinionTally()
+
+        score = o.score
+        tally.total += score
+        tally.count += 1
+        if score < tally.lo:
+            tally.lo = score
+        if score > tally.hi:
+            tally.hi = score
+        tally.by_judge.setdefault(o.judge, o)
+        if o.judge == "Prosecutor":
+            tally.prosecutor = o
+
+        # only the first three of each make it into the report
+        if score >= 4:
+            if len(tally.strengths) < 3:
+                tally.strengths.append(f"{o.judge}: {(o.argument or '').strip()[:180]}")
+        elif score <= 2:
+            if len(tally.weaknesses) < 3:
+                tally.weaknesses.append(f"{o.judge}: {(o.argument or '').strip()[:180]}")
+    return grouped
 
 
-def _final_score_from_opinions(ops: List[JudicialOpinion]) -> Tuple[int, str]:
-    scores = [int(o.score) for o in ops if o.score is not None]
-    if not scores:
+def _final_score_from_tally(tally: _OpinionTally) -> Tuple[int, str]:
+    if not tally.count:
         return 1, "avg=0.00, var=0"
 
-    avg = sum(scores) / len(scores)
+    avg = tally.total / tally.count
     base = int(round(avg))
-    var = _variance(scores)
 
     # mild skepticism boost if big disagreement and prosecutor very low
-    judges = {o.judge: o for o in ops}
-    prosecutor = judges.get("Prosecutor")
-    if prosecutor and int(prosecutor.score) <= 2 and var >= 2:
+    prosecutor = tally.prosecutor
+    if prosecutor and prosecutor.score <= 2 and tally.var >= 2:
         base = max(1, base - 1)
 
-    return max(1, min(5, base)), f"avg={avg:.2f}, var={var}"
+    return max(1, min(5, base)), f"avg={avg:.2f}, var={tally.var}"
 
 
 def _compute_overall(results: List[CriterionResult], weights: Dict[str, float]) -> int:
     if not results:
         return 1
 
-    usable = [(r.final_score, float(weights.get(r.criterion_id, 0.0))) for r in results]
-    usable = [(s, w) for (s, w) in usable if w > 0]
-
-    if usable:
-        weighted_sum = sum(s * w for s, w in usable)
-        wsum = sum(w for _, w in usable)
+    # one pass: weighted mean over positively weighted criteria, plain mean as fallback
+    weighted_sum = wsum = 0.0
+    plain_sum = 0
+    for r in results:
+        w = float(weights.get(r.criterion_id, 0.0))
+        plain_sum += r.final_score
+        if w > 0:
+            weighted_sum += r.final_score * w
+            wsum += w
+
+    if wsum:
         overall = int(round(weighted_sum / wsum))
     else:
-        overall = int(round(sum(r.final_score for r in results) / len(results)))
+        overall = int(round(plain_sum / len(results)))
 
     return max(1, min(5, overall))
 
 
-def _security_flaw_confirmed(evidences: Dict[str, List[Evidence]]) -> bool:
-    """
-    Confirm ONLY when repo evidence explicitly says unsafe execution was DETECTED in code.
-    Avoid triggering on documentation strings like 'no shell=True'.
-    """
-    for _, ev in _flatten_evidence(evidences):
-        goal = (ev.goal or "").lower()
-        if ev.found and "security scan" in goal and "unsafe execution detected" in goal:
-            return True
-    return False
+class _EvidenceFacts(NamedTuple):
+    """Evidence-level facts the synthesis rules check, gathered in one pass."""
+    unsafe_detected: bool
+    security_flaw: bool
+    graph_state_missing: bool
+
+
+def _evidence_facts(evidences: Dict[str, List[Evidence]]) -> _EvidenceFacts:
+    unsafe = security = missing = False
+    for items in (evidences or {}).values():
+        for ev in items or []:
+            if not ev.goal:
+                continue
+            goal = ev.goal.lower()
+            if ev.found:
+                if "unsafe execution detected" in goal:
+                    unsafe = True
+                    # Confirm ONLY when repo evidence explicitly says unsafe execution was
+                    # DETECTED in code; avoid documentation strings like 'no shell=True'.
+                    security = security or "security scan" in goal
+            elif "graph" in goal or "state" in goal:
+                missing = True
+            if security and missing:
+                return _EvidenceFacts(True, True, True)
+    return _EvidenceFacts(unsafe, security, missing)
 
 
-def _fact_supremacy_penalty(criterion_id: str, evidences: Dict[str, List[Evidence]]) -> Optional[str]:
+def _security_flaw_confirmed(facts: _EvidenceFacts) -> bool:
+    return facts.security_flaw
+
+
+def _fact_supremacy_penalty(criterion_id: str, facts: _EvidenceFacts) -> Optional[str]:
     """
     Implements 'fact_supremacy': if evidence FACTS show failure, override generous opinions.
     Returns a short penalty reason if applicable.
     """
-    flat = _flatten_evidence(evidences)
-
     # Confirm unsafe only if the dedicated "unsafe execution detected" evidence exists
-    if criterion_id in ("security_sandboxing", "forensic_accuracy_code"):
-        for _, ev in flat:
-            if ev.found and "unsafe execution detected" in (ev.goal or "").lower():
-                return "Fact supremacy: unsafe execution evidence confirmed."
+    if criterion_id in ("security_sandboxing", "forensic_accuracy_code") and facts.unsafe_detected:
+        return "Fact supremacy: unsafe execution evidence confirmed."
 
     # If graph/state evidence explicitly failed, cap the criterion
-    if criterion_id in ("langgraph_architecture", "forensic_accuracy_code"):
-        for _, ev in flat:
-            g = (ev.goal or "").lower()
-            if ("graph" in g or "state" in g) and (not ev.found):
-                return "Fact supremacy: required graph/state evidence missing."
+    if criterion_id in ("langgraph_architecture", "forensic_accuracy_code") and facts.graph_state_missing:
+        return "Fact supremacy: required graph/state evidence missing."
 
     return None
 
 
 def chief_justice(state: AgentState):
-    evidences: Dict[str, List[Evidence]] = state.get("evidences", {}) or {}
-    opinions: List[JudicialOpinion] = state.get("opinions", []) or []
+    evidences: Dict[str, List[Evidence]] = state.get("evidences") or {}
+    opinions: List[JudicialOpinion] = state.get("opinions") or []
 
-    rubric = _load_rubric_file()
-    dimensions = _load_dimensions(rubric)
-    rules = _load_synthesis_rules(rubric)
-    weights = _weight_map(dimensions)
+    rubric = state.get("rubric") or prepare_rubric()
+    dimensions = rubric["dimensions"]
+    weights = rubric["weights"]
+    facts = _evidence_facts(evidences)
 
     grouped = _group_opinions(opinions)
 
@@ -139,11 +233,11 @@ def chief_justice(state: AgentState):
 
     for d in dimensions:
         cid = d.get("id", "unknown")
-        ops = grouped.get(cid, [])
+        tally = grouped.get(cid)
 
-        if not ops:
+        if tally is None:
             results.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     criterion_id=cid,
                     final_score=1,
                     summary="No judge opinions produced for this criterion.",
@@ -156,23 +250,15 @@ def chief_justice(state: AgentState):
             key_risks.append(f"Missing judge output for {cid}.")
             continue
 
-        final_score, meta = _final_score_from_opinions(ops)
-        scores = [int(o.score) for o in ops if o.score is not None]
-
-        strengths: List[str] = []
-        weaknesses: List[str] = []
-        for o in ops:
-            txt = (o.argument or "").strip()
-            if int(o.score) >= 4:
-                strengths.append(f"{o.judge}: {txt[:180]}")
-            elif int(o.score) <= 2:
-                weaknesses.append(f"{o.judge}: {txt[:180]}")
+        final_score, meta = _final_score_from_tally(tally)
+        strengths = tally.strengths
+        weaknesses = tally.weaknesses
 
         dissent: Optional[str] = None
-        if _variance(scores) >= 2:
+        if tally.var >= 2:
             # satisfy dissent_requirement (prosecutor vs defense)
-            p = next((o for o in ops if o.judge == "Prosecutor"), None)
-            de = next((o for o in ops if o.judge == "Defense"), None)
+            p = tally.by_judge.get("Prosecutor")
+            de = tally.by_judge.get("Defense")
             if p and de:
                 dissent = (
                     f"Prosecutor scored {p.score}/5 emphasizing: {p.argument[:140]}. "
@@ -183,8 +269,8 @@ def chief_justice(state: AgentState):
             next_steps.append(f"Resolve dissent in {cid}: tighten evidence grounding & judge prompts.")
 
         # Fact supremacy override (facts > opinions)
-        if str(rules.get("fact_supremacy", "")).strip():
-            penalty_reason = _fact_supremacy_penalty(cid, evidences)
+        if rubric["fact_supremacy"]:
+            penalty_reason = _fact_supremacy_penalty(cid, facts)
             if penalty_reason:
                 final_score = max(1, min(final_score, 2))
                 weaknesses.append(penalty_reason)
@@ -192,12 +278,14 @@ def chief_justice(state: AgentState):
         if final_score <= 3:
             next_steps.append(f"Improve {cid}: add stronger citations + clearer cross-references (repo <-> report).")
 
+        # final_score is clamped to 1..5 above and the lists are plain strings,
+        # so the result is built without re-validation.
         results.append(
-            CriterionResult(
+            CriterionResult.model_construct(
                 criterion_id=cid,
                 final_score=final_score,
                 summary=f"Chief Justice synthesis ({meta}).",
-                strengths=strengths[:3],
+                strengths=strengths,
                 weaknesses=weaknesses[:3],
                 remediation=[
                     "Address judge weaknesses and add stronger evidence citations.",
@@ -210,22 +298,16 @@ def chief_justice(state: AgentState):
     overall = _compute_overall(results, weights)
 
     # Apply security override if confirmed (STRICT now)
-    security_override = str(rules.get("security_override", "")).lower()
-    if _security_flaw_confirmed(evidences):
+    if _security_flaw_confirmed(facts):
         key_risks.append("Security red flag detected (unsafe system execution).")
         next_steps.append("Fix unsafe execution: remove os.system / shell=True, use safe subprocess calls.")
-        if "cap" in security_override and "3" in security_override:
+        if rubric["security_cap_3"]:
             overall = min(overall, 3)
         else:
             overall = max(1, overall - 1)
 
     # de-dup next steps while preserving order
-    seen = set()
-    next_steps_unique: List[str] = []
-    for s in next_steps:
-        if s not in seen:
-            seen.add(s)
-            next_steps_unique.append(s)
+    next_steps_unique = list(dict.fromkeys(next_steps))
 
     exec_summary = (
         f"Final audit complete. Overall score={overall}/5. "
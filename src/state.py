@@ -24,6 +24,18 @@ class JudicialOpinion(BaseModel):
     cited_evidence: List[str] = Field(default_factory=list)
 
 
+class JudgePanelOpinion(BaseModel):
+    """All three judicial opinions for one criterion, returned by a single batched call."""
+    prosecutor: JudicialOpinion
+    defense: JudicialOpinion
+    techlead: JudicialOpinion
+
+
+class JudgeOpinionBatch(BaseModel):
+    """One judge's opinions on every rubric criterion, returned by a single call."""
+    opinions: List[JudicialOpinion] = Field(default_factory=list)
+
+
 class CriterionResult(BaseModel):
     criterion_id: str
     final_score: int = Field(ge=1, le=5)
@@ -64,6 +76,14 @@ def merge_evidence_dict(
     return out
 
 
+def sum_counts(left: Dict[str, int] | None, right: Dict[str, int] | None) -> Dict[str, int]:
+    """Reducer for per-source evidence counts: adds counts for matching keys."""
+    out: Dict[str, int] = dict(left or {})
+    for src, n in (right or {}).items():
+        out[src] = out.get(src, 0) + int(n or 0)
+    return out
+
+
 def last_write_wins(left: Any, right: Any) -> Any:
     """Reducer for single final values (e.g., final_report)."""
     return right if right is not None else left
@@ -72,9 +92,21 @@ def last_write_wins(left: Any, right: Any) -> Any:
 class AgentState(TypedDict, total=False):
     repo_url: str
     pdf_path: str
+    # Remote HEAD sha (None if unreachable), resolved once per run; the
+    # detectives' cache key.
+    repo_head: Optional[str]
 
     # Detective & Judge aggregation
     evidences: Annotated[Dict[str, List[Evidence]], merge_evidence_dict]
+    # Running totals kept by the reducers as evidence is merged, so judges
+    # don't re-walk every Evidence item to get them.
+    evidence_counts: Annotated[Dict[str, int], sum_counts]
+    evidence_has_failure: Annotated[bool, operator.or_]
+    # Evidence brief + default citations, built once by evidence_aggregator
+    # and read by every judge.
+    judge_inputs: Annotated[Optional[Dict[str, Any]], last_write_wins]
+    # Parsed rubric (dimensions, synthesis rules, weights), loaded once per audit.
+    rubric: Annotated[Optional[Dict[str, Any]], last_write_wins]
     opinions: Annotated[List[JudicialOpinion], operator.add]
 
     # Chief Justice output
@@ -1,6 +1,95 @@
+import functools
+import hashlib
 import os
-from docling.document_converter import DocumentConverter
-from typing import List, Dict
+import re
+from typing import AbstractSet, Dict, List, Optional, Sequence, Tuple
+
+from src.cache import load_json, save_json
+from src.tools.repo_tools import list_repo_files
+
+# Optional Aho–Corasick matcher (pip install pyahocorasick): one pass per chunk
+# regardless of how many concept terms are searched.
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+ConceptTerms = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# Repo-relative file paths quoted in the report, e.g. src/nodes/judges.py.
+# At least one directory component is required so prose like "e.g." never matches.
+_PATH_CLAIM = re.compile(
+    r"(?<![\w/.-])(?:\./)?((?:[\w.-]+/)+[\w.-]+\.(?:py|json|md|toml|txt|ya?ml|lock|cfg|ini|ipynb))\b"
+)
+
+
+@functools.cache
+def _document_converter():
+    """
+    Docling pulls in its OCR/layout models on import, so it is imported and
+    constructed on first ingest only, then shared.
+    """
+    from docling.document_converter import DocumentConverter
+
+    return DocumentConverter()
+
+
+def _iter_chunks(markdown: str, min_len: int = 40):
+    """
+    Yields stripped paragraph chunks longer than `min_len`, scanning for blank-line
+    separators in place instead of materializing the full split() list first.
+    """
+    start = 0
+    end = len(markdown)
+    while start <= end:
+        sep = markdown.find("\n\n", start)
+        if sep == -1:
+            sep = end
+        chunk = markdown[start:sep].strip()
+        if len(chunk) > min_len:
+            yield chunk
+        start = sep + 2
+
+
+# Mapping concepts to variations to handle OCR/Term differences
+CONCEPT_ALIASES: Dict[str, List[str]] = {
+    "LangGraph": ["langgraph", "stategraph", "workflow", "nodes", "edges"],
+    "Parallelism": ["parallel", "fan-out", "fan-in", "concurrent"],
+    "Reducers": ["reducer", "operator", "merge", "aggregate", "ior"],
+    # ✅ ADDED: AST aliases
+    "AST": ["ast", "abstract syntax tree", "syntax tree", "parser"],
+}
+
+
+def _concept_terms(keywords: Sequence[str]) -> ConceptTerms:
+    """(concept, lowered search terms) pairs; a concept without aliases searches for itself."""
+    return tuple(
+        (concept, tuple(term.lower() for term in CONCEPT_ALIASES.get(concept, (str(concept),))))
+        for concept in keywords
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _concept_automaton(concept_terms: ConceptTerms):
+    """
+    Builds (automaton, always_matched) for a concept/term table. The automaton
+    maps each term to (term, every concept it proves, once per listing);
+    concepts with an empty term match any chunk, mirroring `"" in text`.
+    """
+    owners: Dict[str, List[str]] = {}
+    always: List[str] = []
+    for concept, terms in concept_terms:
+        for term in terms:
+            if term:
+                owners.setdefault(term, []).append(concept)
+            else:
+                always.append(concept)
+
+    automaton = ahocorasick.Automaton()
+    for term, concepts in owners.items():
+        automaton.add_word(term, (term, tuple(concepts)))
+    automaton.make_automaton()
+    return automaton, tuple(always)
 
 
 class PDFForensicInterface:
@@ -13,27 +102,55 @@ class PDFForensicInterface:
         self.path = path
         self.chunks = []
         self.metadata = {}
+        # Lower-cased chunks, built once at ingest and scanned by every search.
+        self._lowered: List[str] = []
+        self._lowered_for: Optional[List[str]] = None
+        # targeted_search results per concept tuple; chunks never change after ingest
+        self._search_cache: Dict[Tuple[str, ...], List[Dict]] = {}
+
+    def _set_chunks(self, chunks: List[str]) -> None:
+        self.chunks = chunks
+        self._lowered = [chunk.lower() for chunk in chunks]
+        self._lowered_for = chunks
+        self._search_cache.clear()
+
+    def _content_hash(self) -> Optional[str]:
+        try:
+            with open(self.path, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+        except OSError:
+            return None
 
     def ingest_and_chunk(self) -> bool:
         """
         Converts PDF to Markdown and splits into semantic chunks.
+        Chunks are persisted under audit/.cache/ keyed on the PDF's content hash,
+        so warm runs skip the Docling conversion entirely.
         """
         if not os.path.exists(self.path):
             print(f"Forensic Error: Document not found at {self.path}")
             return False
 
+        digest = self._content_hash()
+        cache_name = f"pdf_chunks_{digest}" if digest else None
+        cached = load_json(cache_name) if cache_name else None
+        if isinstance(cached, list):
+            self._set_chunks([str(c) for c in cached])
+            print(f"✅ Loaded {len(self.chunks)} cached semantic chunks for {self.path}")
+            return True
+
         try:
-            converter = DocumentConverter()
+            converter = _document_converter()
             result = converter.convert(self.path)
 
             # Export to markdown to preserve structural context (headers, lists)
             full_markdown = result.document.export_to_markdown()
+            # The Docling document tree is no longer needed; release it before chunking.
+            del result
 
-            self.chunks = [
-                chunk.strip()
-                for chunk in full_markdown.split("\n\n")
-                if len(chunk.strip()) > 40
-            ]
+            self._set_chunks(list(_iter_chunks(full_markdown)))
+            if cache_name:
+                save_json(cache_name, self.chunks)
 
             print(f"✅ Ingested and created {len(self.chunks)} semantic chunks from {self.path}")
             return True
@@ -42,37 +159,127 @@ class PDFForensicInterface:
             print(f"Ingestion failure: {str(e)}")
             return False
 
-    def targeted_search(self, keywords: List[str]) -> List[Dict]:
+    def targeted_search(self, keywords: Sequence[str]) -> List[Dict]:
         """
         Queries specific chunks based on forensic keywords.
         Returns a list of evidence matches.
+        Results are memoized per keyword tuple for the lifetime of the ingested document.
         """
+        key = tuple(keywords)
+        cached = self._search_cache.get(key)
+        if cached is None:
+            cached = self._search(key)
+            self._search_cache[key] = cached
+        return list(cached)
+
+    def _search(self, keywords: Tuple[str, ...]) -> List[Dict]:
         evidence_found = []
 
-        # Mapping concepts to variations to handle OCR/Term differences
-        aliases = {
-            "LangGraph": ["langgraph", "stategraph", "workflow", "nodes", "edges"],
-            "Parallelism": ["parallel", "fan-out", "fan-in", "concurrent"],
-            "Reducers": ["reducer", "operator", "merge", "aggregate", "ior"],
-            # ✅ ADDED: AST aliases
-            "AST": ["ast", "abstract syntax tree", "syntax tree", "parser"],
-        }
-
-        for i, chunk in enumerate(self.chunks):
-            lower_chunk = chunk.lower()
-
-            for concept in keywords:
-                search_terms = aliases.get(concept, [str(concept).lower()])
-
-                if any(term.lower() in lower_chunk for term in search_terms):
-                    evidence_found.append({
-                        "concept": concept,
-                        "chunk_id": i + 1,
-                        "snippet": chunk[:400].replace("\n", " ") + "...",
-                        "confidence": 0.95
-                    })
+        # Resolve each concept's lowered search terms once, not once per chunk.
+        concept_terms = _concept_terms(keywords)
+
+        automaton = None
+        always: Tuple[str, ...] = ()
+        if ahocorasick is not None and any(terms for _, terms in concept_terms):
+            automaton, always = _concept_automaton(concept_terms)
+
+        if self._lowered_for is not self.chunks:
+            # chunks were assigned directly rather than through ingest
+            self._set_chunks(self.chunks)
+
+        for i, (chunk, lower_chunk) in enumerate(zip(self.chunks, self._lowered)):
+
+            if automaton is not None:
+                hit = set(always)
+                for _, (_, concepts) in automaton.iter(lower_chunk):
+                    hit.update(concepts)
+                matched = [concept for concept, _ in concept_terms if concept in hit]
+            else:
+                matched = [
+                    concept
+                    for concept, search_terms in concept_terms
+                    if any(term in lower_chunk for term in search_terms)
+                ]
+
+            for concept in matched:
+                evidence_found.append({
+                    "concept": concept,
+                    "chunk_id": i + 1,
+                    "snippet": chunk[:400].replace("\n", " ") + "...",
+                    "confidence": 0.95
+                })
 
         return evidence_found
+
+
+    def extract_path_claims(self) -> List[str]:
+        """Unique file-path claims found in the chunks, in order of first mention."""
+        seen: Dict[str, None] = {}
+        for chunk in self.chunks:
+            # Docling escapes markdown underscores (src/nodes/\_x.py)
+            for match in _PATH_CLAIM.finditer(chunk.replace("\\_", "_")):
+                seen.setdefault(match.group(1), None)
+        return list(seen)
+
+    def cross_reference_paths(
+        self,
+        repo_path: Optional[str],
+        known_files: Optional[AbstractSet[str]] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Checks each path claimed in the report against the repository.
+        Returns [{"path": ..., "status": "VERIFIED" | "HALLUCINATED"}].
+        Pass `known_files` (see repo_tools.list_repo_files) to reuse one file index
+        across calls; otherwise it is built from `repo_path` here.
+        """
+        claims = self.extract_path_claims()
+        if not claims:
+            return []
+
+        if known_files is None:
+            if not repo_path:
+                return []
+            known_files = list_repo_files(repo_path)
+
+        return [
+            {"path": claim, "status": "VERIFIED" if claim in known_files else "HALLUCINATED"}
+            for claim in claims
+        ]
+
+
+def search_pdf_concepts(text: str, keywords: Sequence[str]) -> Dict[str, Dict[str, object]]:
+    """
+    Counts concept mentions (including CONCEPT_ALIASES variations) in a whole
+    document. Returns {concept: {"found": bool, "mentions": int}}.
+    With pyahocorasick installed every alias is found in one scan of the text;
+    either way a term's mentions are counted without overlap, as str.count does.
+    """
+    lower_content = (text or "").lower()
+    concept_terms = _concept_terms(keywords)
+    counts: Dict[str, int] = {concept: 0 for concept, _ in concept_terms}
+
+    if ahocorasick is not None and any(terms for _, terms in concept_terms):
+        automaton, always = _concept_automaton(concept_terms)
+        # the automaton reports overlapping matches; keep a term's next one
+        # only once it starts past the end of the last one counted
+        next_free: Dict[str, int] = {}
+        for end, (term, concepts) in automaton.iter(lower_content):
+            if end - len(term) + 1 < next_free.get(term, 0):
+                continue
+            next_free[term] = end + 1
+            for concept in concepts:
+                counts[concept] += 1
+        # an empty term matches at every offset, as str.count("") does
+        for concept in always:
+            counts[concept] += len(lower_content) + 1
+    else:
+        for concept, search_terms in concept_terms:
+            for term in search_terms:
+                counts[concept] += lower_content.count(term)
+
+    return {concept: {"found": n > 0, "mentions": n} for concept, n in counts.items()}
+
+
 def ingest_pdf_simple(path: str) -> str:
     """Quick helper for legacy components."""
     interface = PDFForensicInterface(path)
@@ -1,30 +1,103 @@
 import os
 import ast
+import functools
+import hashlib
+import mmap
+import multiprocessing
+import re
+import shutil
 import tempfile
 import subprocess
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
+
+from src.cache import load_json, save_json
+
+# libgit2 bindings (pip install pygit2): reads history in-process instead of
+# spawning `git log`. Optional; the subprocess path is the fallback.
+try:
+    import pygit2  # type: ignore
+except ImportError:
+    pygit2 = None  # type: ignore
+
+# Rust AST walker (pip install fast-walk) when available. Every check below only
+# collects facts from the node set, so visitation order does not matter.
+try:
+    from fast_walk import walk_unordered as _ast_walk  # type: ignore
+except ImportError:
+    _ast_walk = ast.walk
+
+# Unsafe-call scan tuning: files above LARGE_SCAN_FILE_BYTES (usually generated or
+# vendored) are pre-filtered through mmap and read in full only on a match, and
+# repos below PARALLEL_SCAN_MIN_FILES files per worker are not worth a process pool.
+LARGE_SCAN_FILE_BYTES = 1_000_000
+PARALLEL_SCAN_MIN_FILES = 16
+
+# Superset of what the AST unsafe-call check can flag (os.system / shell=True).
+_UNSAFE_PREFILTER = re.compile(rb"os\s*\.\s*system|shell\s*=\s*True")
+
+# Bump when the AST unsafe-call check changes so cached per-file verdicts are not reused.
+UNSAFE_SCAN_VERSION = "1"
+# In-process layer over those verdicts. The AST check is deterministic, so this
+# is consulted even when AUDITOR_CACHE=off.
+_UNSAFE_VERDICTS: Dict[str, bool] = {}
+
+# Upper bound for `git ls-remote`; a slow or unreachable remote just means no cache key.
+REMOTE_HEAD_TIMEOUT = 15.0
 
 
 # ============================================================
 # SAFE CLONE
 # ============================================================
 
-def clone_repo_sandboxed(repo_url: str) -> Tuple[Optional[str], Optional[tempfile.TemporaryDirectory]]:
+def _git_env() -> Dict[str, str]:
+    # Never block on a credential prompt (private or mistyped repo URLs).
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+def clone_repo_sandboxed(
+    repo_url: str,
+    depth: Optional[int] = 1,
+    single_branch: bool = True,
+    blobless: bool = True,
+) -> Tuple[Optional[str], Optional[tempfile.TemporaryDirectory]]:
     """
     Clones a repository into a temporary directory sandbox.
     Returns (repo_path, temp_dir_object).
     Uses SAFE subprocess call (no shell=True).
+
+    Shallow by default (depth=1, single branch, no tags): file scans never read
+    history. Pass a larger depth when commit messages are needed, or depth=None
+    for a full clone.
+
+    Blobless by default (--filter=blob:none): only the blobs checked out at HEAD
+    are downloaded, so a deeper history costs commits and trees, not old file
+    contents. Servers without partial-clone support ignore the filter.
     """
     temp_dir = tempfile.TemporaryDirectory()
     repo_path = os.path.join(temp_dir.name, "repo")
 
+    cmd = ["git", "clone", "--quiet", "--no-tags"]
+    if depth:
+        cmd.append(f"--depth={int(depth)}")
+    if single_branch:
+        cmd.append("--single-branch")
+    if blobless:
+        cmd.append("--filter=blob:none")
+    cmd += [repo_url, repo_path]
+
     try:
+        # only stderr is reported (on failure); --quiet keeps it to errors
         subprocess.run(
-            ["git", "clone", repo_url, repo_path],
+            cmd,
             check=True,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
+            env=_git_env(),
         )
         return repo_path, temp_dir
 
@@ -34,11 +107,151 @@ def clone_repo_sandboxed(repo_url: str) -> Tuple[Optional[str], Optional[tempfil
         temp_dir.cleanup()
         return None, None
 
+    except OSError as e:
+        # git itself could not be started (e.g. not installed)
+        print(f"[ERROR] Git clone failed: {e}")
+        temp_dir.cleanup()
+        return None, None
+
+
+class _SharedClone:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.refs = 0
+        self.attempted = False
+        self.path: Optional[str] = None
+        self.temp_dir: Optional[tempfile.TemporaryDirectory] = None
+
+
+_SHARED_CLONES: Dict[str, _SharedClone] = {}
+_SHARED_CLONES_LOCK = threading.Lock()
+
+
+def acquire_shared_clone(repo_url: str, depth: Optional[int] = 1) -> Optional[str]:
+    """
+    Reference-counted clone shared by concurrent callers (the detectives run in
+    parallel). The first caller clones; the rest reuse its checkout.
+    Every call must be paired with release_shared_clone(repo_url), even when
+    the clone failed and None was returned.
+    """
+    with _SHARED_CLONES_LOCK:
+        entry = _SHARED_CLONES.setdefault(repo_url, _SharedClone())
+        entry.refs += 1
+
+    with entry.lock:
+        if not entry.attempted:
+            # Mark the attempt first: whatever happens, later callers reuse this
+            # outcome instead of retrying, and the reference taken above stays
+            # releasable.
+            entry.attempted = True
+            try:
+                entry.path, entry.temp_dir = clone_repo_sandboxed(repo_url, depth=depth)
+            except Exception as e:
+                # clone_repo_sandboxed handles git failures itself; this covers
+                # e.g. git missing from PATH (FileNotFoundError).
+                print(f"[ERROR] Git clone failed: {type(e).__name__}: {e}")
+                entry.path, entry.temp_dir = None, None
+    return entry.path
+
+
+def release_shared_clone(repo_url: str) -> None:
+    """Drops one reference; the last holder deletes the sandbox."""
+    with _SHARED_CLONES_LOCK:
+        entry = _SHARED_CLONES.get(repo_url)
+        if entry is None:
+            return
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+        del _SHARED_CLONES[repo_url]
+
+    if entry.temp_dir:
+        entry.temp_dir.cleanup()
+
+
+def list_repo_files(repo_path: str) -> FrozenSet[str]:
+    """
+    Every file in the checkout as a repo-relative, '/'-separated path (.git excluded).
+    Built in one scandir pass so path-claim checks are set lookups, not stat calls.
+    """
+    files: List[str] = []
+    stack = [("", repo_path)]
+    while stack:
+        prefix, current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    rel = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            stack.append((rel + "/", entry.path))
+                    else:
+                        files.append(rel)
+        except OSError:
+            continue
+    return frozenset(files)
+
+
+def resolve_remote_head(repo_url: str, timeout: float = REMOTE_HEAD_TIMEOUT) -> Optional[str]:
+    """
+    Returns the commit SHA that HEAD points to on the remote, without cloning.
+    Used as a freshness key for cached forensic results.
+    Returns None if the remote cannot be queried within `timeout` seconds.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", repo_url, "HEAD"],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+            env=_git_env(),
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return None
+
+    parts = result.stdout.split()
+    return parts[0] if parts else None
+
 
 # ============================================================
 # GIT HISTORY EXTRACTION (WITH TIMESTAMPS)
 # ============================================================
 
+def _git_history_pygit2(repo_path: str, max_commits: int) -> Optional[List[Dict[str, str]]]:
+    """In-process equivalent of the `git log` call below; None if pygit2 is unavailable or fails."""
+    if pygit2 is None:
+        return None
+
+    try:
+        repo = pygit2.Repository(repo_path)
+        walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+
+        structured: List[Dict[str, str]] = []
+        for commit in walker:
+            if len(structured) >= max_commits:
+                break
+            author = commit.author
+            tz = timezone(timedelta(minutes=author.offset))
+            # %s: first paragraph of the message, folded onto one line
+            subject = " ".join(commit.message.split("\n\n", 1)[0].split())
+            structured.append(
+                {
+                    "hash": str(commit.id),
+                    "date": datetime.fromtimestamp(author.time, tz).isoformat(),
+                    "author": author.name.strip(),
+                    "message": subject,
+                }
+            )
+    except Exception:
+        return None
+
+    # match `git log --reverse`: oldest of the selected commits first
+    structured.reverse()
+    return structured
+
+
 def extract_git_history(repo_path: str, max_commits: int = 50) -> List[Dict[str, str]]:
     """
     Extracts commit history to check development progression.
@@ -46,8 +259,12 @@ def extract_git_history(repo_path: str, max_commits: int = 50) -> List[Dict[str,
     Returns list of dicts:
       { "hash": "...", "date": "...", "author": "...", "message": "..." }
 
-    Uses a safe subprocess call (no shell=True).
+    Uses pygit2 when installed, otherwise a safe subprocess call (no shell=True).
     """
+    history = _git_history_pygit2(repo_path, max_commits)
+    if history is not None:
+        return history
+
     try:
         # ISO-ish date for easy reading; includes timezone.
         # Format: HASH|DATE|AUTHOR|SUBJECT
@@ -68,10 +285,11 @@ def extract_git_history(repo_path: str, max_commits: int = 50) -> List[Dict[str,
             text=True,
         )
 
-        lines = [ln for ln in result.stdout.splitlines() if ln.strip()]
         structured: List[Dict[str, str]] = []
 
-        for ln in lines:
+        for ln in result.stdout.splitlines():
+            if not ln.strip():
+                continue
             parts = ln.split("|", 3)
             if len(parts) != 4:
                 continue
@@ -126,6 +344,7 @@ def _const_str(node: ast.AST) -> Optional[str]:
 # ARCHITECTURE CHECKS (RUBRIC-STRONG)
 # ============================================================
 
+@functools.lru_cache(maxsize=32)
 def _has_typed_state_with_reducers(state_py: str) -> Dict[str, bool]:
     """
     Verifies:
@@ -142,7 +361,7 @@ def _has_typed_state_with_reducers(state_py: str) -> Dict[str, bool]:
     has_reducer_ior = False
     has_reducer_add = False
 
-    for node in ast.walk(tree):
+    for node in _ast_walk(tree):
         # class AgentState(TypedDict)
         if isinstance(node, ast.ClassDef) and node.name in ("AgentState", "State", "GraphState"):
             bases = []
@@ -168,6 +387,7 @@ def _has_typed_state_with_reducers(state_py: str) -> Dict[str, bool]:
     }
 
 
+@functools.lru_cache(maxsize=32)
 def _graph_structure_checks(graph_py: str) -> Dict[str, Any]:
     """
     Checks graph orchestration patterns via AST:
@@ -198,7 +418,7 @@ def _graph_structure_checks(graph_py: str) -> Dict[str, Any]:
     node_names: set[str] = set()
     edges: List[Tuple[str, str]] = []
 
-    for node in ast.walk(tree):
+    for node in _ast_walk(tree):
         if isinstance(node, ast.Call):
             fn = _call_attr_name(node)
 
@@ -270,76 +490,228 @@ def _call_name(node: ast.AST) -> str:
     - subprocess.run
     - run (if imported directly)
     """
+    parts: List[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
     if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        left = _call_name(node.value)
-        if left:
-            return f"{left}.{node.attr}"
-        return node.attr
-    return ""
+        parts.append(node.id)
+    # a non-name base (e.g. f().run) is dropped, keeping the attribute chain
+    return ".".join(reversed(parts))
 
 
-def _detect_unsafe_calls_in_file(py_path: str) -> bool:
-    """
-    Detects actual unsafe calls using AST:
-    - os.system(...)
-    - subprocess.<any>(..., shell=True)
-    """
+def _unsafe_calls_in_source(raw: bytes) -> bool:
     try:
-        with open(py_path, "r", encoding="utf-8", errors="ignore") as f:
-            src = f.read()
-
-        tree = ast.parse(src)
+        tree = ast.parse(raw.decode("utf-8", errors="ignore"))
     except Exception:
         # If we can't parse the file, don't block grading; treat as not-unsafe
         return False
 
-    for node in ast.walk(tree):
+    for node in _ast_walk(tree):
         if not isinstance(node, ast.Call):
             continue
 
-        name = _call_name(node.func)
+        # Both rules need an attribute call, so the dotted name is only built
+        # for <x>.system(...) or calls passing shell=True.
+        func = node.func
+        if not isinstance(func, ast.Attribute):
+            continue
 
         # 1) os.system(...)
-        if name == "os.system":
+        if func.attr == "system" and _call_name(func) == "os.system":
             return True
 
         # 2) subprocess.*(..., shell=True)
-        if name.startswith("subprocess.") and _is_shell_true(node):
+        if node.keywords and _is_shell_true(node) and _call_name(func).startswith("subprocess."):
             return True
 
     return False
 
 
-def _detect_unsafe_calls(repo_path: str) -> List[str]:
+def _read_unsafe_candidate(py_path: str) -> Optional[bytes]:
+    """File bytes if they pass the unsafe-call pre-filter, else None (also on read errors)."""
+    try:
+        with open(py_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= LARGE_SCAN_FILE_BYTES:
+                raw = f.read()
+                return raw if _UNSAFE_PREFILTER.search(raw) else None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:] if _UNSAFE_PREFILTER.search(mm) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _unsafe_verdict_key(raw: bytes) -> str:
+    return hashlib.sha256(UNSAFE_SCAN_VERSION.encode("ascii") + b"\n" + raw).hexdigest()[:32]
+
+
+def _cached_unsafe_verdict(key: str) -> Optional[bool]:
+    """Verdict from memory, then audit/.cache/unsafe/; None when the content was never scanned."""
+    hit = _UNSAFE_VERDICTS.get(key)
+    if hit is None:
+        cached = load_json(f"unsafe/{key}")
+        if isinstance(cached, bool):
+            hit = _UNSAFE_VERDICTS[key] = cached
+    return hit
+
+
+def _remember_unsafe_verdict(key: str, hit: bool) -> None:
+    _UNSAFE_VERDICTS[key] = hit
+    save_json(f"unsafe/{key}", hit)
+
+
+def _detect_unsafe_calls_in_file(py_path: str) -> bool:
     """
-    Detects usage of unsafe execution patterns with AST parsing:
+    Detects actual unsafe calls using AST:
     - os.system(...)
-    - subprocess.*(..., shell=True)
+    - subprocess.<any>(..., shell=True)
 
-    Skips virtualenv, caches, git, and our own tooling file.
+    A byte-level regex pre-filter rejects files that cannot contain either
+    pattern, so only candidates pay for ast.parse. The AST pass still confirms
+    every hit (comments and strings are not flagged). Verdicts for candidates
+    are memoized in-process and under audit/.cache/unsafe/ by content hash, so
+    files unchanged since an earlier audit (of any commit) are not parsed again.
     """
-    unsafe_files: List[str] = []
+    raw = _read_unsafe_candidate(py_path)
+    if raw is None:
+        return False
 
-    SKIP_DIRS = {".venv", "__pycache__", ".git", ".mypy_cache", ".pytest_cache"}
-    SKIP_FILES = {"repo_tools.py"}
+    key = _unsafe_verdict_key(raw)
+    hit = _cached_unsafe_verdict(key)
+    if hit is None:
+        hit = _unsafe_calls_in_source(raw)
+        _remember_unsafe_verdict(key, hit)
+    return hit
 
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
-        for name in files:
-            if not name.endswith(".py"):
-                continue
-            if name in SKIP_FILES:
-                continue
+def _scan_workers() -> int:
+    """CPU count available to this process (respects affinity on Linux)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _scan_mp_context() -> Any:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+_SCAN_SKIP_DIRS = frozenset(
+    {".venv", "__pycache__", ".git", ".mypy_cache", ".pytest_cache", ".tox", "node_modules"}
+)
+_SCAN_SKIP_FILES = frozenset({"repo_tools.py"})
+
+
+def _iter_py_files(repo_path: str) -> Iterator[str]:
+    """
+    .py files under repo_path outside the skipped dirs/files. Uses scandir's
+    cached entry types, so directories are told from files without a stat each.
+    Symlinks are not followed (a checkout can link outside itself), matching rg.
+    """
+    stack = [repo_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SCAN_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith(".py") and name not in _SCAN_SKIP_FILES and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _rg_unsafe_candidates(repo_path: str) -> Optional[List[str]]:
+    """
+    Asks ripgrep for the .py files matching the unsafe-call pre-filter, so the
+    tree walk and the byte scan happen in one native, multi-threaded pass.
+    Returns None when rg is not installed or fails, so callers fall back to the Python walk.
+    """
+    rg = shutil.which("rg")
+    if not rg:
+        return None
+
+    # Match _UNSAFE_PREFILTER byte for byte: -U lets \s cross newlines, -a and
+    # --encoding none search files with NUL bytes or a BOM as raw bytes.
+    # Symlinks are not followed, as in _iter_py_files.
+    cmd = [
+        rg, "--files-with-matches", "-U", "-a", "--encoding", "none",
+        "--no-ignore", "--hidden", "--no-messages", "--glob", "*.py",
+    ]
+    for name in sorted(_SCAN_SKIP_DIRS | _SCAN_SKIP_FILES):
+        cmd += ["--glob", f"!{name}"]
+    cmd += ["-e", _UNSAFE_PREFILTER.pattern.decode("ascii"), repo_path]
+
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except OSError:
+        return None
+
+    # rg exits 1 when nothing matched
+    if result.returncode not in (0, 1):
+        return None
+    return sorted(line for line in result.stdout.splitlines() if line.endswith(".py"))
 
-            full_path = os.path.join(root, name)
 
-            if _detect_unsafe_calls_in_file(full_path):
-                unsafe_files.append(full_path)
+def _detect_unsafe_calls(repo_path: str) -> List[str]:
+    """
+    Detects usage of unsafe execution patterns with AST parsing:
+    - os.system(...)
+    - subprocess.*(..., shell=True)
 
-    return unsafe_files
+    Skips virtualenv, caches, git, vendored deps and our own tooling file.
+    With ripgrep installed the tree walk and byte pre-filter run natively;
+    otherwise both happen here. Contents already scanned are answered from the
+    verdict caches, and only when many remain are they parsed in a process pool.
+    """
+    paths = _rg_unsafe_candidates(repo_path)
+
+    if paths is None:
+        # sorted to match the rg listing
+        paths = sorted(_iter_py_files(repo_path))
+
+    # Pre-filter and cache lookups happen here, so only unseen candidate
+    # contents are parsed and every new verdict lands in this process's memo.
+    verdicts: Dict[str, bool] = {}
+    pending: List[Tuple[str, str, bytes]] = []
+    for path in paths:
+        raw = _read_unsafe_candidate(path)
+        if raw is None:
+            continue
+        key = _unsafe_verdict_key(raw)
+        hit = _cached_unsafe_verdict(key)
+        if hit is None:
+            pending.append((path, key, raw))
+        else:
+            verdicts[path] = hit
+
+    sources = [raw for _, _, raw in pending]
+    workers = min(_scan_workers(), max(1, len(pending) // PARALLEL_SCAN_MIN_FILES))
+    hits: List[bool] = []
+
+    if workers > 1:
+        try:
+            # The detectives run in threads; forking a multithreaded process can
+            # deadlock, so workers are started fresh (forkserver/spawn) instead.
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_scan_mp_context()) as ex:
+                hits = list(ex.map(_unsafe_calls_in_source, sources, chunksize=16))
+        except (OSError, BrokenProcessPool) as e:
+            # Some sandboxes forbid worker processes; fall back to the serial scan.
+            print(f"[WARN] Parallel unsafe-call scan unavailable ({e}); scanning serially.")
+            hits = []
+
+    if len(hits) != len(pending):
+        hits = [_unsafe_calls_in_source(raw) for raw in sources]
+
+    for (path, key, _), hit in zip(pending, hits):
+        _remember_unsafe_verdict(key, hit)
+        verdicts[path] = hit
+
+    return [p for p in paths if verdicts.get(p)]
 
 
 # ============================================================
@@ -382,8 +754,10 @@ def verify_graph_forensics(repo_path: str) -> Dict[str, Any]:
     with open(state_path, "r", encoding="utf-8", errors="ignore") as f:
         state_src = f.read()
 
-    graph_checks = _graph_structure_checks(graph_src)
-    state_checks = _has_typed_state_with_reducers(state_src)
+    # Both checks are pure functions of the source text and are lru-cached on
+    # it, so an unchanged graph.py/state.py is not re-parsed; copy the cached dicts.
+    graph_checks = dict(_graph_structure_checks(graph_src))
+    state_checks = dict(_has_typed_state_with_reducers(state_src))
     unsafe_files = _detect_unsafe_calls(repo_path)
     git_history = extract_git_history(repo_path)
 
@@ -1,6 +1,7 @@
 import pytest
 import os
 import sys
+import struct
 
 # Ensure src is in the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -8,6 +9,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.tools.doc_tools import search_pdf_concepts
 # Generic import to avoid name errors
 import src.tools.repo_tools as repo_tools
+from src.nodes import detectives
+from src.state import Evidence
 
 def test_search_pdf_concepts_found():
     """Verify that the search logic correctly identifies keywords with aliases."""
@@ -35,4 +38,71 @@ def test_repo_tools_path_exists():
     """Verify the repo tools module is present and loadable."""
     # This verifies your infrastructure is set up correctly
     assert repo_tools is not None
-    assert os.path.exists("src/tools/repo_tools.py")
\ No newline at end of file
+    assert os.path.exists("src/tools/repo_tools.py")
+
+
+def _evidence(found=True):
+    return Evidence(goal="g", found=found, location="repo", rationale="r", confidence=0.5)
+
+
+def test_memoized_evidence_does_not_cache_failures(monkeypatch):
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    monkeypatch.setattr(detectives, "_EVIDENCE_CACHE", {})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [_evidence(found=False)], True
+
+    assert detectives._memoized_evidence("k", compute)[1] is True
+    assert detectives._memoized_evidence("k", compute)[1] is True
+    assert len(calls) == 2
+
+
+def test_memoized_evidence_returns_copies(monkeypatch):
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    monkeypatch.setattr(detectives, "_EVIDENCE_CACHE", {})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return [_evidence()], False
+
+    first, _ = detectives._memoized_evidence("k", compute)
+    first[0].rationale = "mutated"
+    second, failed = detectives._memoized_evidence("k", compute)
+
+    assert len(calls) == 1
+    assert failed is False
+    assert second[0].rationale == "r"
+
+
+def _dims(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return detectives._image_dims(str(path))
+
+
+def test_image_dims_from_png_header(tmp_path):
+    data = b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", 640, 480)
+    assert _dims(tmp_path, "a.png", data) == (640, 480)
+
+
+def test_image_dims_from_jpeg_frame_header(tmp_path):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, 480, 640) + b"\x00" * 10
+    assert _dims(tmp_path, "a.jpg", b"\xff\xd8" + app0 + sof0) == (640, 480)
+
+
+def _webp(chunk, payload):
+    return b"RIFF" + struct.pack("<I", 0) + b"WEBP" + chunk + struct.pack("<I", len(payload)) + payload
+
+
+def test_image_dims_from_webp_headers(tmp_path):
+    vp8 = _webp(b"VP8 ", b"\x00\x00\x00\x9d\x01\x2a" + struct.pack("<HH", 640, 480))
+    vp8l = _webp(b"VP8L", b"\x2f" + struct.pack("<I", (640 - 1) | (480 - 1) << 14) + b"\x00" * 5)
+    vp8x = _webp(b"VP8X", b"\x00" * 4 + (640 - 1).to_bytes(3, "little") + (480 - 1).to_bytes(3, "little"))
+
+    assert _dims(tmp_path, "a.webp", vp8) == (640, 480)
+    assert _dims(tmp_path, "b.webp", vp8l) == (640, 480)
+    assert _dims(tmp_path, "c.webp", vp8x) == (640, 480)
@@ -0,0 +1,112 @@
+import os
+import sys
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.tools.doc_tools as doc_tools
+from src.tools.doc_tools import PDFForensicInterface, search_pdf_concepts
+
+
+def _interface(*chunks):
+    interface = PDFForensicInterface("report.pdf")
+    interface.chunks = list(chunks)
+    return interface
+
+
+def test_path_claims_unescape_docling_underscores():
+    """Docling writes src/nodes/\\_x.py; the claim must come out as src/nodes/_x.py."""
+    interface = _interface("The helpers live in src/nodes/\\_helpers.py and src/state.py.")
+
+    assert interface.extract_path_claims() == ["src/nodes/_helpers.py", "src/state.py"]
+
+
+def test_path_claims_require_allowed_suffix():
+    """Only source/config suffixes count as file claims."""
+    interface = _interface("See docs/diagram.png, src/graph.py, build/app.exe and config/rubric.json.")
+
+    assert interface.extract_path_claims() == ["src/graph.py", "config/rubric.json"]
+
+
+def test_path_claims_require_a_directory():
+    """Bare file names and prose like e.g. are not claims."""
+    interface = _interface("We edited graph.py (e.g. the fan-out) and ./src/tools/repo_tools.py.")
+
+    assert interface.extract_path_claims() == ["src/tools/repo_tools.py"]
+
+
+def test_path_claims_are_unique_in_order_of_first_mention():
+    interface = _interface("src/b.py then src/a.py", "src/b.py again")
+
+    assert interface.extract_path_claims() == ["src/b.py", "src/a.py"]
+
+
+def test_cross_reference_marks_verified_and_hallucinated():
+    interface = _interface("Implemented in src/graph.py and src/nodes/missing.py.")
+
+    results = interface.cross_reference_paths(None, known_files=frozenset({"src/graph.py"}))
+
+    assert results == [
+        {"path": "src/graph.py", "status": "VERIFIED"},
+        {"path": "src/nodes/missing.py", "status": "HALLUCINATED"},
+    ]
+
+
+def test_cross_reference_builds_the_file_index_from_the_repo(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "graph.py").write_text("")
+    interface = _interface("Implemented in src/graph.py and src/state.py.")
+
+    results = interface.cross_reference_paths(str(tmp_path))
+
+    assert [r["status"] for r in results] == ["VERIFIED", "HALLUCINATED"]
+
+
+def test_cross_reference_without_claims_or_repo_is_empty():
+    assert _interface("No paths here at all.").cross_reference_paths(None) == []
+    assert _interface("Only src/graph.py").cross_reference_paths(None) == []
+
+
+class _BruteForceAutomaton:
+    """pyahocorasick stand-in: reports every (overlapping) match as (end index, value)."""
+
+    def __init__(self):
+        self.words = {}
+
+    def add_word(self, word, value):
+        self.words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, text):
+        hits = []
+        for word, value in self.words.items():
+            start = text.find(word)
+            while start != -1:
+                hits.append((start + len(word) - 1, value))
+                start = text.find(word, start + 1)
+        return sorted(hits, key=lambda hit: hit[0])
+
+
+class _FakeAhoCorasick:
+    Automaton = _BruteForceAutomaton
+
+
+def test_concept_counts_do_not_depend_on_pyahocorasick(monkeypatch):
+    text = "aaaaa StateGraph stategraph nodes; fan-out and fan-out"
+    keywords = ["aa", "LangGraph", "Parallelism", "LangGraph", ""]
+
+    monkeypatch.setattr(doc_tools, "ahocorasick", None)
+    plain = search_pdf_concepts(text, keywords)
+
+    doc_tools._concept_automaton.cache_clear()
+    monkeypatch.setattr(doc_tools, "ahocorasick", _FakeAhoCorasick)
+    try:
+        automaton = search_pdf_concepts(text, keywords)
+    finally:
+        doc_tools._concept_automaton.cache_clear()
+
+    assert automaton == plain
+    assert plain["aa"]["mentions"] == 2  # "aaaaa" holds two non-overlapping "aa"
+    assert plain["LangGraph"]["mentions"] == 6  # three alias hits, counted per listing
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import os
+import sys
+import types
+from collections import OrderedDict
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import cache
+from src.nodes import judges
+from src.state import Evidence, JudgeOpinionBatch, JudicialOpinion
+
+
+class _StubLLM:
+    """Structured-LLM stand-in: records prompts and returns `respond(prompt)`."""
+
+    def __init__(self, respond, delay=0.0):
+        self.respond = respond
+        self.delay = delay
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay)
+        return self.respond(prompt)
+
+
+def _opinion(cid, argument="per criterion"):
+    return JudicialOpinion(judge="Defense", criterion_id=cid, score=4, argument=argument)
+
+
+CRITERIA = [{"id": "graph_orchestration"}, {"id": "state_management"}]
+
+
+def _llm_env(monkeypatch):
+    monkeypatch.setenv("LLM_MODE", "llm")
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("GROQ_RPM", "0")
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    monkeypatch.delenv("JUDGE_PANEL", raising=False)
+    monkeypatch.delenv("JUDGE_BATCH", raising=False)
+    monkeypatch.setattr(judges, "_load_rubric", lambda *a, **k: list(CRITERIA))
+
+
+def test_evidence_stats_reads_the_aggregates():
+    state = {"evidence_counts": {"repo": 3, "doc": 2}, "evidence_has_failure": True}
+
+    assert judges._evidence_stats(state) == (5, True)
+
+
+def test_evidence_stats_walks_evidence_without_aggregates():
+    ok = Evidence(goal="g", found=True, location="repo", rationale="r", confidence=0.5)
+    missing = ok.model_copy(update={"found": False})
+
+    assert judges._evidence_stats({"evidences": {"repo": [ok, ok], "doc": [ok]}}) == (3, False)
+    assert judges._evidence_stats({"evidences": {"repo": [ok], "doc": [missing]}}) == (2, True)
+    assert judges._evidence_stats({}) == (0, False)
+
+
+def test_run_judge_batch_rejects_mismatched_ids(monkeypatch):
+    _llm_env(monkeypatch)
+    wrong = JudgeOpinionBatch(opinions=[_opinion("graph_orchestration"), _opinion("unknown")])
+    monkeypatch.setattr(judges, "_get_structured_llm", lambda schema: _StubLLM(lambda p: wrong))
+
+    result = asyncio.run(judges._run_judge_batch("Prosecutor", CRITERIA, "mismatch evidence"))
+
+    assert result is None
+
+
+def test_run_judge_falls_back_to_per_criterion_calls(monkeypatch):
+    _llm_env(monkeypatch)
+    monkeypatch.setenv("JUDGE_BATCH_CRITERIA", "1")
+    wrong = JudgeOpinionBatch(opinions=[_opinion("graph_orchestration")])
+    batch_llm = _StubLLM(lambda p: wrong)
+    single_llm = _StubLLM(lambda p: _opinion("ignored"))
+    monkeypatch.setattr(
+        judges, "_get_structured_llm",
+        lambda schema: batch_llm if schema is JudgeOpinionBatch else single_llm,
+    )
+    state = {"evidences": {}}
+
+    opinions = asyncio.run(judges._run_judge("Prosecutor", state))["opinions"]
+
+    assert len(batch_llm.prompts) == 1
+    assert len(single_llm.prompts) == len(CRITERIA)
+    assert [o.criterion_id for o in opinions] == [c["id"] for c in CRITERIA]
+    assert {o.judge for o in opinions} == {"Prosecutor"}
+    assert {o.argument for o in opinions} == {"per criterion"}
+
+
+def test_token_bucket_allows_a_burst_then_waits():
+    async def run():
+        loop = asyncio.get_running_loop()
+        bucket = judges._TokenBucket(600)  # 10 tokens per second
+
+        start = loop.time()
+        for _ in range(600):
+            await bucket.acquire()
+        burst = loop.time() - start
+
+        start = loop.time()
+        await bucket.acquire()
+        return burst, loop.time() - start
+
+    burst, waited = asyncio.run(run())
+
+    assert burst < 0.5
+    assert waited >= 0.08
+
+
+def test_rpm_limit_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("GROQ_RPM", raising=False)
+
+    async def run():
+        await judges._rpm_token()
+        return dict(judges._RPM_BUCKETS)
+
+    assert asyncio.run(run()) == {}
+
+
+def test_ainvoke_cached_shares_concurrent_identical_calls(monkeypatch):
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    llm = _StubLLM(lambda prompt: _opinion("graph_orchestration"), delay=0.01)
+
+    async def run():
+        call = cache.ainvoke_cached(llm, "inflight dedup prompt", "test-model", JudicialOpinion)
+        return await asyncio.gather(call, cache.ainvoke_cached(
+            llm, "inflight dedup prompt", "test-model", JudicialOpinion
+        ))
+
+    first, second = asyncio.run(run())
+
+    assert len(llm.prompts) == 1
+    assert first == second
+    assert first is not second
+    assert cache._LLM_INFLIGHT == {}
+
+
+class _FakeGroq:
+    """AsyncGroq stand-in for the Batch API: one job per submit, answered from `respond`."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.submitted = []
+        self.status = "completed"
+        self.files = types.SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = types.SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    async def _upload(self, file, purpose):
+        self.submitted.append(file[1].decode("utf-8").splitlines())
+        return types.SimpleNamespace(id=f"file-{len(self.submitted)}")
+
+    async def _create(self, input_file_id, endpoint, completion_window):
+        return types.SimpleNamespace(id=input_file_id.replace("file", "batch"))
+
+    async def _retrieve(self, batch_id):
+        return types.SimpleNamespace(status=self.status, output_file_id=batch_id.replace("batch", "out"))
+
+    async def _content(self, file_id):
+        lines = self.submitted[int(file_id.split("-")[1]) - 1]
+        out = []
+        for line in lines:
+            request = json.loads(line)
+            prompt = request["body"]["messages"][0]["content"]
+            content = self.respond(prompt)
+            out.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {"body": {"choices": [{"message": {"content": content}}]}},
+            }))
+        return types.SimpleNamespace(text="\n".join(out))
+
+
+def _groq_batch_env(monkeypatch, tmp_path, client):
+    _llm_env(monkeypatch)
+    monkeypatch.delenv("AUDITOR_CACHE")
+    monkeypatch.setattr(cache, "_repo_root", lambda: tmp_path)
+    monkeypatch.setattr(cache, "_LLM_MEMORY", OrderedDict())
+    monkeypatch.setitem(sys.modules, "groq", types.SimpleNamespace(AsyncGroq=lambda: client))
+    tokens = []
+
+    async def rpm_token():
+        tokens.append(1)
+
+    monkeypatch.setattr(judges, "_rpm_token", rpm_token)
+    return tokens
+
+
+def _batch_judge():
+    return asyncio.run(judges._run_judge_groq_batch("Prosecutor", CRITERIA, "batch evidence", [], (0, False)))
+
+
+def test_groq_batch_submits_only_uncached_prompts_and_caches_answers(monkeypatch, tmp_path):
+    client = _FakeGroq(lambda prompt: _opinion("x", argument="from batch").model_dump_json())
+    tokens = _groq_batch_env(monkeypatch, tmp_path, client)
+    cached_prompt = judges._judge_prompt("Prosecutor", CRITERIA[0], "batch evidence")
+    cache.remember_llm_answer(
+        judges._cache_model_key(), cached_prompt, _opinion("x", argument="from cache").model_dump(mode="json")
+    )
+
+    opinions = _batch_judge()
+
+    assert len(client.submitted) == 1 and len(client.submitted[0]) == 1
+    assert tokens == [1]
+    assert [o.argument for o in opinions] == ["from cache", "from batch"]
+    assert [o.criterion_id for o in opinions] == [c["id"] for c in CRITERIA]
+
+    cache._LLM_MEMORY.clear()  # the second run is served from disk
+    assert [o.argument for o in _batch_judge()] == ["from cache", "from batch"]
+    assert len(client.submitted) == 1
+
+
+def test_groq_batch_timeout_leaves_the_job_for_a_rerun(monkeypatch, tmp_path):
+    client = _FakeGroq(lambda prompt: _opinion("x", argument="late").model_dump_json())
+    _groq_batch_env(monkeypatch, tmp_path, client)
+    monkeypatch.setenv("BATCH_TIMEOUT", "0")
+    client.status = "in_progress"
+
+    assert _batch_judge() is None
+    assert len(client.submitted) == 1
+
+    client.status = "completed"
+    opinions = _batch_judge()
+
+    assert len(client.submitted) == 1
+    assert [o.argument for o in opinions] == ["late", "late"]
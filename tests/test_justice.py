@@ -0,0 +1,101 @@
+import os
+import random
+import sys
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.nodes.justice import _final_score_from_tally, _group_opinions, chief_justice, prepare_rubric
+from src.state import JudicialOpinion
+
+
+JUDGE_NAMES = ("Prosecutor", "Defense", "TechLead")
+
+
+def _baseline(ops):
+    """The original per-criterion chief_justice synthesis, kept as the reference."""
+    scores = [int(o.score) for o in ops]
+    avg = sum(scores) / len(scores)
+    base = int(round(avg))
+    var = max(scores) - min(scores)
+    judges = {o.judge: o for o in ops}
+    prosecutor = judges.get("Prosecutor")
+    if prosecutor and int(prosecutor.score) <= 2 and var >= 2:
+        base = max(1, base - 1)
+    score = max(1, min(5, base))
+
+    strengths, weaknesses = [], []
+    for o in ops:
+        txt = (o.argument or "").strip()
+        if int(o.score) >= 4:
+            strengths.append(f"{o.judge}: {txt[:180]}")
+        elif int(o.score) <= 2:
+            weaknesses.append(f"{o.judge}: {txt[:180]}")
+
+    dissent = None
+    if var >= 2:
+        p = next((o for o in ops if o.judge == "Prosecutor"), None)
+        de = next((o for o in ops if o.judge == "Defense"), None)
+        if p and de:
+            dissent = (
+                f"Prosecutor scored {p.score}/5 emphasizing: {p.argument[:140]}. "
+                f"Defense scored {de.score}/5 emphasizing: {de.argument[:140]}."
+            )
+        else:
+            dissent = "High disagreement between judges. Review evidence grounding."
+
+    return score, f"avg={avg:.2f}, var={var}", strengths[:3], weaknesses[:3], dissent
+
+
+def _random_opinions(rng, criterion_ids):
+    opinions = []
+    for cid in criterion_ids:
+        # duplicates and missing judges included, as a resumed run can produce
+        for _ in range(rng.randint(1, 5)):
+            opinions.append(JudicialOpinion(
+                judge=rng.choice(JUDGE_NAMES),
+                criterion_id=cid,
+                score=rng.randint(1, 5),
+                argument=" " * rng.randint(0, 30) + "x" * rng.randint(0, 300) + " " * rng.randint(0, 3),
+            ))
+    rng.shuffle(opinions)
+    return opinions
+
+
+def test_tally_matches_the_original_scoring():
+    rng = random.Random(7)
+    for _ in range(300):
+        opinions = _random_opinions(rng, ["a", "b", "c"])
+        grouped = _group_opinions(opinions)
+
+        for cid, tally in grouped.items():
+            ops = [o for o in opinions if o.criterion_id == cid]
+            score, meta, strengths, weaknesses, _ = _baseline(ops)
+
+            assert _final_score_from_tally(tally) == (score, meta)
+            assert tally.strengths == strengths
+            assert tally.weaknesses == weaknesses
+
+
+def test_chief_justice_matches_the_original_synthesis():
+    rubric = prepare_rubric()
+    criterion_ids = [d["id"] for d in rubric["dimensions"]]
+    rng = random.Random(11)
+
+    for _ in range(20):
+        opinions = _random_opinions(rng, criterion_ids[:-1])
+        report = chief_justice({"evidences": {}, "opinions": opinions, "rubric": rubric})["final_report"]
+
+        for result in report.criteria[:-1]:
+            ops = [o for o in opinions if o.criterion_id == result.criterion_id]
+            score, meta, strengths, weaknesses, dissent = _baseline(ops)
+
+            assert result.final_score == score
+            assert result.summary == f"Chief Justice synthesis ({meta})."
+            assert result.strengths == strengths
+            assert result.weaknesses == weaknesses
+            assert result.dissent == dissent
+
+        missing = report.criteria[-1]
+        assert missing.final_score == 1
+        assert missing.weaknesses == ["Missing judge evaluation output."]
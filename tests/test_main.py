@@ -0,0 +1,70 @@
+import asyncio
+import operator
+import os
+import sys
+from typing import Annotated, List, TypedDict
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import main
+
+
+def test_thread_id_changes_with_the_repo_head():
+    first = main._thread_id("https://example.com/r.git", "report.pdf", "a" * 40)
+
+    assert first == main._thread_id("https://example.com/r.git", "report.pdf", "a" * 40)
+    assert first != main._thread_id("https://example.com/r.git", "report.pdf", "b" * 40)
+    assert first != main._thread_id("https://example.com/r.git", "report.pdf", None)
+
+
+class _LogState(TypedDict):
+    log: Annotated[List[str], operator.add]
+
+
+def _flaky_graph(calls, fail_once):
+    """detect -> judge; judge raises on its first call while `fail_once` is set."""
+
+    def detect(state):
+        calls.append("detect")
+        return {"log": ["detect"]}
+
+    def judge(state):
+        calls.append("judge")
+        if fail_once:
+            fail_once.pop()
+            raise RuntimeError("crashed mid-graph")
+        return {"log": ["judge"]}
+
+    builder = StateGraph(_LogState)
+    builder.add_node("detect", detect)
+    builder.add_node("judge", judge)
+    builder.add_edge(START, "detect")
+    builder.add_edge("detect", "judge")
+    builder.add_edge("judge", END)
+    return builder
+
+
+def test_interrupted_thread_resumes_and_finished_thread_starts_clean():
+    calls = []
+    checkpointer = InMemorySaver()
+    app = _flaky_graph(calls, [True]).compile(checkpointer=checkpointer)
+    state = {"log": []}
+
+    async def run():
+        return await main._ainvoke_resumable(app, checkpointer, state, "thread")
+
+    try:
+        asyncio.run(run())
+    except RuntimeError:
+        pass
+    assert calls == ["detect", "judge"]
+
+    assert asyncio.run(run())["log"] == ["detect", "judge"]
+    assert calls == ["detect", "judge", "judge"]  # the detector did not run again
+
+    assert asyncio.run(run())["log"] == ["detect", "judge"]  # nothing appended to the old run
+    assert calls == ["detect", "judge", "judge", "detect", "judge"]
@@ -0,0 +1,137 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.tools.repo_tools as repo_tools
+
+
+class _FakeTempDir:
+    def __init__(self):
+        self.cleaned = 0
+
+    def cleanup(self):
+        self.cleaned += 1
+
+
+def test_shared_clone_clones_once_and_cleans_up_after_last_release(monkeypatch):
+    temp_dir = _FakeTempDir()
+    clones = []
+
+    def fake_clone(repo_url, depth=1):
+        clones.append(repo_url)
+        return "/tmp/checkout", temp_dir
+
+    monkeypatch.setattr(repo_tools, "clone_repo_sandboxed", fake_clone)
+    monkeypatch.setattr(repo_tools, "_SHARED_CLONES", {})
+    url = "https://example.com/repo.git"
+
+    assert repo_tools.acquire_shared_clone(url) == "/tmp/checkout"
+    assert repo_tools.acquire_shared_clone(url) == "/tmp/checkout"
+    assert clones == [url]
+
+    repo_tools.release_shared_clone(url)
+    assert temp_dir.cleaned == 0
+    repo_tools.release_shared_clone(url)
+    assert temp_dir.cleaned == 1
+    assert repo_tools._SHARED_CLONES == {}
+
+
+def test_shared_clone_failure_keeps_refcount_balanced(monkeypatch):
+    def failing_clone(repo_url, depth=1):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(repo_tools, "clone_repo_sandboxed", failing_clone)
+    monkeypatch.setattr(repo_tools, "_SHARED_CLONES", {})
+    url = "https://example.com/repo.git"
+
+    assert repo_tools.acquire_shared_clone(url) is None
+    repo_tools.release_shared_clone(url)
+
+    assert repo_tools._SHARED_CLONES == {}
+    # releasing an unknown clone is a no-op
+    repo_tools.release_shared_clone(url)
+
+
+def _write_sources(root, sources):
+    for name, text in sources.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return root
+
+
+UNSAFE_SOURCES = {
+    "app/run.py": "import os\nos.system('ls')\n",
+    "app/shell.py": "import subprocess\nsubprocess.run('ls', shell=True)\n",
+    "app/docs.py": "# never call os.system here\nHELP = 'avoid shell=True'\n",
+    "app/clean.py": "import subprocess\nsubprocess.run(['ls'])\n",
+}
+
+
+def _scan(monkeypatch, repo):
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    monkeypatch.setattr(repo_tools, "_UNSAFE_VERDICTS", {})
+    monkeypatch.setattr(repo_tools, "_rg_unsafe_candidates", lambda repo_path: None)
+    return [os.path.relpath(p, repo) for p in repo_tools._detect_unsafe_calls(str(repo))]
+
+
+def test_unsafe_scan_reads_large_files(monkeypatch, tmp_path):
+    repo = _write_sources(tmp_path, UNSAFE_SOURCES)
+    monkeypatch.setattr(repo_tools, "LARGE_SCAN_FILE_BYTES", 16)
+
+    assert _scan(monkeypatch, repo) == ["app/run.py", "app/shell.py"]
+
+
+def test_unsafe_scan_process_pool_matches_serial_scan(monkeypatch, tmp_path, capsys):
+    sources = {f"pkg{i}/{name}": text for i in range(3) for name, text in UNSAFE_SOURCES.items()}
+    repo = _write_sources(tmp_path, sources)
+    serial = _scan(monkeypatch, repo)
+
+    monkeypatch.setattr(repo_tools, "PARALLEL_SCAN_MIN_FILES", 1)
+    monkeypatch.setattr(repo_tools, "_scan_workers", lambda: 2)
+    pooled = _scan(monkeypatch, repo)
+
+    assert "scanning serially" not in capsys.readouterr().out
+    assert pooled == serial
+    assert len(pooled) == 6
+    # verdicts computed in the workers land in the parent's memo, one per distinct source
+    assert len(repo_tools._UNSAFE_VERDICTS) == 3
+
+
+def _edge_repo(root):
+    """Sources the pre-filter must catch however the scan is run."""
+    _write_sources(root, {
+        "app/split_call.py": "import subprocess\nsubprocess.run('ls', shell=\n    True)\n",
+        "app/split_attr.py": "import os\n(os.\n    system)('ls')\n",
+        "app/clean.py": "print('nothing to see')\n",
+    })
+    (root / "app" / "nul.py").write_bytes(b"BLOB = '\\0'\x00\nimport os\nos.system('ls')\n")
+    os.symlink(root / "app" / "split_call.py", root / "app" / "linked.py")
+    return root
+
+
+requires_rg = pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+
+
+@requires_rg
+def test_rg_candidates_match_the_python_prefilter(tmp_path):
+    repo = str(_edge_repo(tmp_path))
+    python_side = sorted(p for p in repo_tools._iter_py_files(repo) if repo_tools._read_unsafe_candidate(p))
+
+    assert [os.path.relpath(p, repo) for p in python_side] == ["app/nul.py", "app/split_attr.py", "app/split_call.py"]
+    assert repo_tools._rg_unsafe_candidates(repo) == python_side
+
+
+@requires_rg
+def test_unsafe_verdicts_do_not_depend_on_rg(monkeypatch, tmp_path):
+    repo = _edge_repo(tmp_path)
+    monkeypatch.setenv("AUDITOR_CACHE", "off")
+    monkeypatch.setattr(repo_tools, "_UNSAFE_VERDICTS", {})
+    with_rg = [os.path.relpath(p, repo) for p in repo_tools._detect_unsafe_calls(str(repo))]
+
+    assert with_rg == _scan(monkeypatch, repo) == ["app/split_attr.py", "app/split_call.py"]
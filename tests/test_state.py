@@ -0,0 +1,24 @@
+import os
+import sys
+
+# Ensure src is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.state import sum_counts
+
+
+def test_sum_counts_adds_matching_sources():
+    assert sum_counts({"repo": 2, "doc": 1}, {"doc": 3, "vision": 1}) == {"repo": 2, "doc": 4, "vision": 1}
+
+
+def test_sum_counts_handles_missing_sides():
+    assert sum_counts(None, {"repo": 2}) == {"repo": 2}
+    assert sum_counts({"repo": 2}, None) == {"repo": 2}
+    assert sum_counts(None, None) == {}
+
+
+def test_sum_counts_does_not_mutate_inputs():
+    left = {"repo": 1}
+    sum_counts(left, {"repo": 1})
+
+    assert left == {"repo": 1}